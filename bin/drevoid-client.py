@@ -2,12 +2,11 @@
 
 import os
 import sys
-from pathlib import Path
 
 # Add src directory to path
-src_path = Path(__file__).resolve().parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 from drevoid.client.chat_client import ChatClient
 from drevoid.ui.shell import ChatShell
@@ -39,13 +38,13 @@ def show_banner():
 def main():
     """Main entry point."""
     try:
-        os.system("cls" if os.name == "nt" else "clear")
-        show_banner()
-
         client = ChatClient()
         shell = ChatShell(client)
         client.shell = shell
 
+        shell.do_clear("")
+        show_banner()
+
         # Auto-connect if arguments provided
         if len(sys.argv) >= 4:
             host = sys.argv[1]
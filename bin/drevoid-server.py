@@ -1,12 +1,12 @@
 """Server application entry point."""
 
+import os
 import sys
-from pathlib import Path
 
 # Add src directory to path
-src_path = Path(__file__).resolve().parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 from drevoid.server.server import ChatServer
 
@@ -7,7 +7,6 @@ Entry point for the 'dre' command.
 import sys
 import os
 import argparse
-from pathlib import Path
 
 from drevoid.client.chat_client import ChatClient
 from drevoid.ui.shell import ChatShell
@@ -53,13 +52,13 @@ def start_client(host=None, port=None, username=None, room=None):
         room: Room to join on startup (optional)
     """
     try:
-        os.system("cls" if os.name == "nt" else "clear")
-        show_banner()
-
         client = ChatClient()
         shell = ChatShell(client)
         client.shell = shell
 
+        shell.do_clear("")
+        show_banner()
+
         # If connection parameters provided, auto-connect
         if host and port and username:
             print(f"\n{colorize('Connecting...', Colors.CYAN)}")
@@ -3,12 +3,12 @@
 import socket
 import threading
 import time
-from typing import Optional
+from typing import List, Optional
 
 from .connection import ConnectionManager
 from .room_manager import RoomManager
 from .message_handler import MessageHandler
-from ..core.protocol import MessageType, serialize_message, deserialize_message, create_message
+from ..core.protocol import MessageType, serialize_message, deserialize_message, unpack_messages, create_message
 from ..ctf.flag_detector import FlagDetector
 from ..utils.emoji_aliases import EmojiAliases
 from ..utils.notifications import NotificationManager
@@ -19,10 +19,10 @@ class MessageBuffer:
 
     def __init__(self):
         """Initialize message buffer."""
-        self.buffer = b""
+        self.buffer = bytearray()
 
-    def add_data(self, data: bytes) -> None:
-        """Add data to buffer."""
+    def add_data(self, data) -> None:
+        """Add data (bytes or memoryview) to buffer."""
         self.buffer += data
 
     def get_message(self) -> tuple[Optional[dict], bool]:
@@ -35,6 +35,18 @@ class MessageBuffer:
         message, self.buffer = deserialize_message(self.buffer)
         return message, message is not None
 
+    def get_messages(self) -> List[dict]:
+        """
+        Extract every complete message from buffer, keeping any partial tail.
+
+        Returns:
+            List of parsed messages (possibly empty)
+        """
+        messages, consumed = unpack_messages(self.buffer)
+        if consumed:
+            del self.buffer[:consumed]
+        return messages
+
     def is_empty(self) -> bool:
         """Check if buffer is empty."""
         return len(self.buffer) == 0
@@ -80,6 +92,11 @@ class ChatClient:
         """Get current room name."""
         return self.room_manager.current_room
 
+    @property
+    def state_version(self) -> int:
+        """Counter that changes whenever connected, username or current_room does."""
+        return self.connection_manager.state_version + self.room_manager.state_version
+
     def connect(self, host: str = "ch.tubox.cloud", port: int = 8891, username: str = "") -> bool:
         """
         Connect to server.
@@ -96,6 +113,7 @@ class ChatClient:
             return False
 
         self.connection_manager.username = username
+        self.connection_manager.state_version += 1
         self.message_handler.set_username(username)
 
         self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
@@ -190,16 +208,18 @@ class ChatClient:
 
     def _receive_loop(self) -> None:
         """Receive and process messages from server (runs in thread)."""
+        # One receive buffer for the life of the connection
+        recv_buffer = bytearray(self.connection_manager.RECV_CHUNK_SIZE)
+        recv_view = memoryview(recv_buffer)
+        receive_into = self.connection_manager.receive_into
+
         while self.connected and not self._shutdown_requested:
-            data = self.connection_manager.receive_data()
-            if data is None:
+            received = receive_into(recv_buffer)
+            if not received:
                 break
 
-            self.message_buffer.add_data(data)
-            while True:
-                message, has_message = self.message_buffer.get_message()
-                if not has_message:
-                    break
+            self.message_buffer.add_data(recv_view[:received])
+            for message in self.message_buffer.get_messages():
                 if not self._shutdown_requested:
                     self.message_handler.handle(message, self.current_room or "")
                     if self.shell:
@@ -212,7 +232,8 @@ class ChatClient:
 
             try:
                 print(
-                    f"\n{colorize('Connection lost. Type connect to reconnect.', Colors.RED)}"
+                    f"\n{colorize('Connection lost. Type connect to reconnect.', Colors.RED)}",
+                    flush=True,
                 )
             except Exception:
                 pass
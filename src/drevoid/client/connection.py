@@ -15,11 +15,15 @@ from ..core.protocol import (
 class ConnectionManager:
     """Manages socket connection and data transmission with the server."""
 
+    RECV_CHUNK_SIZE = 4096
+
     def __init__(self):
         """Initialize connection manager."""
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.username: Optional[str] = None
+        # Bumped whenever connected or username changes
+        self.state_version = 0
 
     def connect(self, host: str, port: int) -> bool:
         """
@@ -34,8 +38,14 @@ class ConnectionManager:
         """
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                # Chat frames are small; send each one without Nagle's delay
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
             self.socket.connect((host, port))
             self.connected = True
+            self.state_version += 1
             return True
         except Exception as e:
             print(f"{colorize('❌ Connection failed:', Colors.RED)} {e}")
@@ -50,6 +60,7 @@ class ConnectionManager:
             except Exception:
                 pass
             self.connected = False
+            self.state_version += 1
 
     def send_data(self, message: dict) -> bool:
         """
@@ -65,11 +76,12 @@ class ConnectionManager:
             return False
         try:
             data = serialize_message(message)
-            self.socket.send(data)
+            self.socket.sendall(data)
             return True
         except Exception as e:
             print(f"{colorize('❌ Send error:', Colors.RED)} {e}")
             self.connected = False
+            self.state_version += 1
             return False
 
     def receive_data(self, buffer_size: int = 4096) -> Optional[bytes]:
@@ -90,8 +102,30 @@ class ConnectionManager:
                 return None
             return data
         except Exception as e:
-            if self.connected:
-                # Only print error if it's not a "bad file descriptor" during shutdown
-                if "Bad file descriptor" not in str(e):
-                    print(f"{colorize('❌ Receive error:', Colors.RED)} {e}")
+            self._report_receive_error(e)
             return None
+
+    def receive_into(self, buffer) -> int:
+        """
+        Receive data from server into a caller-owned buffer.
+
+        Args:
+            buffer: Writable buffer (bytearray or memoryview) to fill
+
+        Returns:
+            Number of bytes received, 0 on error/disconnect
+        """
+        if not self.connected:
+            return 0
+        try:
+            return self.socket.recv_into(buffer)
+        except Exception as e:
+            self._report_receive_error(e)
+            return 0
+
+    def _report_receive_error(self, error: Exception) -> None:
+        """Print a receive error unless it is the socket closing during shutdown."""
+        if self.connected:
+            # Only print error if it's not a "bad file descriptor" during shutdown
+            if "Bad file descriptor" not in str(error):
+                print(f"{colorize('❌ Receive error:', Colors.RED)} {error}")
@@ -203,34 +203,41 @@ class MessageHandler:
         rooms = data.get("rooms", [])
         users = data.get("users", [])
         stats = data.get("stats", {})
+        display_message = self._display_message
 
         display = f"\n{StatusIndicator.SUCCESS} {colorize(message_text, Colors.GREEN)}"
-        self._display_message(display)
+        display_message(display)
 
         if rooms:
             display = f"\n{colorize('🏠 Available Rooms:', Colors.BOLD + Colors.CYAN)}"
-            self._display_message(display)
+            display_message(display)
+            format_room = RoomDisplay.format_room
             for room in rooms:
-                display = RoomDisplay.format_room(room)
-                self._display_message(display)
+                display_message(format_room(room))
 
         if users:
-            display = UserDisplay.format_users_list(users)
-            self._display_message(display)
+            display = f"\n{colorize('👥 Users in room:', Colors.BOLD + Colors.CYAN)}"
+            display_message(display)
+            format_user = UserDisplay.format_user
+            for user in sorted(users, key=UserDisplay.sort_key):
+                display = format_user(
+                    user.get("username", "?"), user.get("role", "user"), user.get("is_moderator", False)
+                )
+                display_message(f"  {display}")
 
         if stats:
             uptime = stats.get("uptime", 0)
             hours = int(uptime // 3600)
             minutes = int((uptime % 3600) // 60)
             display = f"\n{colorize('📊 Server Stats:', Colors.BOLD + Colors.YELLOW)}"
-            self._display_message(display)
+            display_message(display)
             from ..ui.ui_components import UIBox
             display = UIBox.stat_row("Connected Users:", str(stats.get("connected_users", 0)))
-            self._display_message(display)
+            display_message(display)
             display = UIBox.stat_row("Active Rooms:", str(stats.get("active_rooms", 0)))
-            self._display_message(display)
+            display_message(display)
             display = UIBox.stat_row("Server Uptime:", f"{hours:02d}:{minutes:02d}")
-            self._display_message(display)
+            display_message(display)
 
     def _handle_error(self, data: dict, time_str: str) -> None:
         """Handle error response."""
@@ -17,6 +17,8 @@ class RoomManager:
         self.connection_manager = connection_manager
         self.current_room: Optional[str] = None
         self.is_muted: bool = False  # Track mute status
+        # Bumped whenever current_room changes
+        self.state_version = 0
 
     def join(self, room_name: str, password: str = "") -> bool:
         """
@@ -35,6 +37,7 @@ class RoomManager:
         )
         if self.connection_manager.send_data(message):
             self.current_room = room_name
+            self.state_version += 1
             return True
         return False
 
@@ -50,6 +53,7 @@ class RoomManager:
         message = create_message(MessageType.LEAVE_ROOM, {})
         if self.connection_manager.send_data(message):
             self.current_room = None
+            self.state_version += 1
             return True
         return False
     
@@ -63,6 +67,7 @@ class RoomManager:
         """
         if self.current_room:
             self.current_room = None
+            self.state_version += 1
             return True
         return False
 
@@ -7,9 +7,12 @@ from .protocol import (
     create_message,
     serialize_message,
     deserialize_message,
+    deserialize_message_at,
+    unpack_messages,
     hash_password,
     format_timestamp,
     ThreadSafeDict,
+    CopyOnWriteDict,
     Colors,
     colorize,
 )
@@ -21,9 +24,12 @@ __all__ = [
     "create_message",
     "serialize_message",
     "deserialize_message",
+    "deserialize_message_at",
+    "unpack_messages",
     "hash_password",
     "format_timestamp",
     "ThreadSafeDict",
+    "CopyOnWriteDict",
     "Colors",
     "colorize",
 ]
@@ -11,7 +11,28 @@ import threading
 import hashlib
 import time
 from enum import Enum
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the wire format is plain JSON either way
+    orjson = None
+
+
+# Frame header: 4-byte big-endian unsigned payload length
+_FRAME_HEADER = struct.Struct("!I")
+_HEADER_SIZE = _FRAME_HEADER.size
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    _json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def _json_dumps(obj) -> bytes:
+        return _json_encode(obj).encode("utf-8")
+
+    _json_loads = json.loads
 
 
 class MessageType(Enum):
@@ -97,9 +118,8 @@ def serialize_message(message: dict) -> bytes:
     Returns:
         Bytes ready for socket transmission
     """
-    json_data = json.dumps(message).encode("utf-8")
-    length = len(json_data)
-    return struct.pack("!I", length) + json_data
+    json_data = _json_dumps(message)
+    return _FRAME_HEADER.pack(len(json_data)) + json_data
 
 
 def deserialize_message(data: bytes) -> Tuple[Optional[dict], bytes]:
@@ -115,17 +135,61 @@ def deserialize_message(data: bytes) -> Tuple[Optional[dict], bytes]:
         Tuple of (parsed_message, remaining_buffer)
         If insufficient data: (None, original_data)
     """
-    if len(data) < 4:
+    if len(data) < _HEADER_SIZE:
         return None, data
 
-    length = struct.unpack("!I", data[:4])[0]
-    if len(data) < 4 + length:
+    end = _HEADER_SIZE + _FRAME_HEADER.unpack_from(data)[0]
+    if len(data) < end:
         return None, data
 
-    json_data = data[4 : 4 + length]
-    message = json.loads(json_data.decode("utf-8"))
-    remaining = data[4 + length :]
-    return message, remaining
+    # Both decoders accept UTF-8 bytes directly, so no separate decode pass
+    message = _json_loads(data[_HEADER_SIZE:end])
+    return message, data[end:]
+
+
+def deserialize_message_at(data, offset: int = 0) -> Tuple[Optional[dict], int]:
+    """
+    Deserialize the message starting at offset, without slicing off the tail.
+
+    Args:
+        data: Raw bytes (or bytearray) from socket
+        offset: Index of the frame header within data
+
+    Returns:
+        Tuple of (parsed_message, next_offset)
+        If insufficient data: (None, offset)
+    """
+    start = offset + _HEADER_SIZE
+    if len(data) < start:
+        return None, offset
+
+    end = start + _FRAME_HEADER.unpack_from(data, offset)[0]
+    if len(data) < end:
+        return None, offset
+
+    return _json_loads(data[start:end]), end
+
+
+def unpack_messages(data) -> Tuple[List[dict], int]:
+    """
+    Deserialize every complete message at the front of a buffer.
+
+    Walks the frames by offset, so a chunk carrying many messages is
+    parsed without copying the remaining buffer after each one.
+
+    Args:
+        data: Raw bytes (or bytearray) from socket
+
+    Returns:
+        Tuple of (parsed_messages, bytes_consumed)
+    """
+    messages = []
+    offset = 0
+    while True:
+        message, offset = deserialize_message_at(data, offset)
+        if message is None:
+            return messages, offset
+        messages.append(message)
 
 
 def hash_password(password: str) -> str:
@@ -187,6 +251,11 @@ class ThreadSafeDict:
         with self._lock:
             return key in self._dict
 
+    def __len__(self):
+        """Return number of items with lock protection."""
+        with self._lock:
+            return len(self._dict)
+
     def get(self, key, default=None):
         """Get item with default, lock protected."""
         with self._lock:
@@ -223,6 +292,90 @@ class ThreadSafeDict:
             self._dict.update(other)
 
 
+class CopyOnWriteDict:
+    """
+    Dictionary for read-heavy shared state using copy-on-write snapshots.
+
+    Writers copy the current dict under a lock, modify the copy and
+    publish it with a single attribute rebind. Readers never lock: they
+    always see either the previous or the new snapshot, never a partial
+    update. Exposes the same interface as ThreadSafeDict.
+    """
+
+    def __init__(self):
+        """Initialize copy-on-write dictionary."""
+        self._dict = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        """Get item from current snapshot."""
+        return self._dict[key]
+
+    def __setitem__(self, key, value):
+        """Publish a snapshot with key set."""
+        with self._lock:
+            snapshot = dict(self._dict)
+            snapshot[key] = value
+            self._dict = snapshot
+
+    def __delitem__(self, key):
+        """Publish a snapshot without key."""
+        with self._lock:
+            snapshot = dict(self._dict)
+            del snapshot[key]
+            self._dict = snapshot
+
+    def __contains__(self, key):
+        """Check membership in current snapshot."""
+        return key in self._dict
+
+    def __len__(self):
+        """Return number of items in current snapshot."""
+        return len(self._dict)
+
+    def get(self, key, default=None):
+        """Get item with default from current snapshot."""
+        return self._dict.get(key, default)
+
+    def snapshot(self) -> dict:
+        """Return the current snapshot (must not be modified)."""
+        return self._dict
+
+    def keys(self):
+        """Return list of keys (snapshot)."""
+        return list(self._dict)
+
+    def values(self):
+        """Return list of values (snapshot)."""
+        return list(self._dict.values())
+
+    def items(self):
+        """Return list of items (snapshot)."""
+        return list(self._dict.items())
+
+    def pop(self, key, default=None):
+        """Publish a snapshot without key and return its value."""
+        with self._lock:
+            if key not in self._dict:
+                return default
+            snapshot = dict(self._dict)
+            value = snapshot.pop(key)
+            self._dict = snapshot
+            return value
+
+    def clear(self):
+        """Publish an empty snapshot."""
+        with self._lock:
+            self._dict = {}
+
+    def update(self, other):
+        """Publish a snapshot updated with another dict."""
+        with self._lock:
+            snapshot = dict(self._dict)
+            snapshot.update(other)
+            self._dict = snapshot
+
+
 class Colors:
     """ANSI color codes for terminal output styling."""
 
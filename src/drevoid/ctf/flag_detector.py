@@ -3,7 +3,7 @@
 import re
 import time
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from .flag_patterns import get_all_patterns
 
 
@@ -40,6 +40,8 @@ class FlagDetector:
         """Initialize flag detector with all patterns."""
         self.flags_found: Dict[str, Flag] = {}
         self.patterns = get_all_patterns()
+        self._flags_version = 0
+        self._flags_cache: Optional[Tuple[int, Tuple[Flag, ...]]] = None
 
     def detect(self, content: str) -> List[str]:
         """
@@ -78,17 +80,26 @@ class FlagDetector:
                 timestamp=time.time(),
                 message_preview=message_preview,
             )
+            self._flags_version += 1
             return True
         return False
 
-    def get_all_flags(self) -> List[Flag]:
+    def get_all_flags(self) -> Tuple[Flag, ...]:
         """
         Retrieve all captured flags.
 
+        The snapshot is rebuilt only after a new flag is stored or the
+        store is cleared, and is shared between callers.
+
         Returns:
-            List of Flag objects
+            Tuple of Flag objects
         """
-        return list(self.flags_found.values())
+        version = self._flags_version
+        cached = self._flags_cache
+        if cached is None or cached[0] != version:
+            cached = (version, tuple(self.flags_found.values()))
+            self._flags_cache = cached
+        return cached[1]
 
     def get_flag(self, flag_content: str) -> Flag | None:
         """
@@ -129,7 +140,13 @@ class FlagDetector:
     def clear(self) -> None:
         """Clear all stored flags."""
         self.flags_found.clear()
+        self._flags_version += 1
 
     def get_count(self) -> int:
         """Get total number of captured flags."""
         return len(self.flags_found)
+
+    @property
+    def count(self) -> int:
+        """Total number of captured flags."""
+        return len(self.flags_found)
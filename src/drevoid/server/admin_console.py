@@ -13,6 +13,49 @@ if TYPE_CHECKING:
     from .server import ChatServer
 
 
+# Fixed console messages, built once at import time
+_INFO_NO_CONNECTED_USERS = StatusIndicator.INFO + " No connected users"
+_ERR_USER_IS_NOT_IN_ROOM = StatusIndicator.ERROR + " User is not in any room"
+_INFO_NO_ROOMS_AVAILABLE = StatusIndicator.INFO + " No rooms available"
+_INFO_NO_FLAGS_CAPTURED_YET = StatusIndicator.INFO + " No flags captured yet"
+_ERR_INVALID_USER_ARGUMENT = StatusIndicator.ERROR + " Invalid --user argument"
+_WARN_DELETE_ALL_FLAGS = StatusIndicator.WARNING + " This will delete all flags!"
+_INFO_NO_LOGS_AVAILABLE = StatusIndicator.INFO + " No logs available"
+_WARN_DELETE_ALL_SERVER_LOGS = StatusIndicator.WARNING + " This will delete all server logs!"
+_INFO_NO_USER_DATA_AVAILABLE = StatusIndicator.INFO + " No user data available"
+_ERR_ROOM_ALREADY_EXISTS = StatusIndicator.ERROR + " Room already exists"
+_ERR_CANNOT_DELETE_ROOM = StatusIndicator.ERROR + " Cannot delete room (doesn't exist or is protected)"
+_ERR_ROOM_NOT_FOUND = StatusIndicator.ERROR + " Room not found"
+_ERR_USER_NOT_FOUND = StatusIndicator.ERROR + " User not found"
+_ERR_USER_NOT_IN_ROOM = StatusIndicator.ERROR + " User not in any room"
+_ERR_USER_NOT_MUTED_GLOBALLY = StatusIndicator.ERROR + " User not muted globally"
+_INFO_NO_WARNINGS_ISSUED = StatusIndicator.INFO + " No warnings issued"
+_INFO_NO_MATCHING_USERS = StatusIndicator.INFO + " No users found matching criteria"
+_INFO_NO_GLOBALLY_BANNED_USERS = StatusIndicator.INFO + " No globally banned users"
+_ERR_NOT_GLOBALLY_BANNED = StatusIndicator.ERROR + " User not in global ban list"
+_OK_ALERTS_ENABLED = StatusIndicator.SUCCESS + " Alerts enabled"
+_OK_ALERTS_DISABLED = StatusIndicator.SUCCESS + " Alerts disabled"
+_INFO_STOPPING_SERVER = StatusIndicator.INFO + " Stopping server..."
+
+# Usage lines for commands that take arguments
+_USAGE_BAN = StatusIndicator.ERROR + " Usage: ban <username> [--global]"
+_USAGE_KICK = StatusIndicator.ERROR + " Usage: kick <username>"
+_USAGE_REMOVE = StatusIndicator.ERROR + " Usage: remove <username> [reason]"
+_USAGE_BROADCAST = StatusIndicator.ERROR + " Usage: broadcast <message>"
+_USAGE_ROOM_CREATE = StatusIndicator.ERROR + " Usage: room_create <name> [--private] [--max <count>]"
+_USAGE_ROOM_DELETE = StatusIndicator.ERROR + " Usage: room_delete <name> [--confirm]"
+_USAGE_ROOM_INFO = StatusIndicator.ERROR + " Usage: room_info <name>"
+_USAGE_MUTE = StatusIndicator.ERROR + " Usage: mute <username> [--global] [--duration <sec>]"
+_USAGE_UNMUTE = StatusIndicator.ERROR + " Usage: unmute <username> [--global]"
+_USAGE_USER_HISTORY = StatusIndicator.ERROR + " Usage: user_history <username>"
+_USAGE_TRACK_USER = StatusIndicator.ERROR + " Usage: track_user <username>"
+_USAGE_SEARCH_USERS = StatusIndicator.ERROR + " Usage: search_users --role <role> | --room <room>"
+_USAGE_GLOBAL_BAN = StatusIndicator.ERROR + " Usage: global_ban <username> [reason]"
+_USAGE_UNBAN_GLOBAL = StatusIndicator.ERROR + " Usage: unban_global <username>"
+_USAGE_ALERTS = StatusIndicator.ERROR + " Usage: alerts --enable | --disable | --status"
+_USAGE_SCHEDULE_ANNOUNCEMENT = StatusIndicator.ERROR + " Usage: schedule_announcement <message>"
+
+
 class AdminConsole(cmd.Cmd):
     """Advanced admin console for server management."""
 
@@ -64,7 +107,7 @@ class AdminConsole(cmd.Cmd):
         clients = self.server.client_handler.clients
 
         if not clients.keys():
-            print(f"{StatusIndicator.INFO} No connected users")
+            print(_INFO_NO_CONNECTED_USERS)
             return
 
         print(f"\n{UIBox.section('Connected Users', Colors.CYAN)}")
@@ -106,7 +149,7 @@ class AdminConsole(cmd.Cmd):
     def do_ban(self, arg: str) -> None:
         """Ban a user from a room or globally. Usage: ban <username> [--global]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: ban <username> [--global]")
+            print(_USAGE_BAN)
             return
 
         parts = arg.split()
@@ -120,7 +163,7 @@ class AdminConsole(cmd.Cmd):
 
         room = self.server.room_manager.get_user_room(username)
         if not room:
-            print(f"{StatusIndicator.ERROR} User is not in any room")
+            print(_ERR_USER_IS_NOT_IN_ROOM)
             return
 
         # Ban user
@@ -149,7 +192,7 @@ class AdminConsole(cmd.Cmd):
     def do_kick(self, arg: str) -> None:
         """Kick a user from current room. Usage: kick <username>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: kick <username>")
+            print(_USAGE_KICK)
             return
 
         username = arg.strip()
@@ -161,7 +204,7 @@ class AdminConsole(cmd.Cmd):
 
         room = self.server.room_manager.get_user_room(username)
         if not room:
-            print(f"{StatusIndicator.ERROR} User is not in any room")
+            print(_ERR_USER_IS_NOT_IN_ROOM)
             return
 
         # Kick user
@@ -186,7 +229,7 @@ class AdminConsole(cmd.Cmd):
     def do_remove(self, arg: str) -> None:
         """Remove/disconnect a user. Usage: remove <username> [reason]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: remove <username> [reason]")
+            print(_USAGE_REMOVE)
             return
 
         parts = arg.split(None, 1)
@@ -221,7 +264,7 @@ class AdminConsole(cmd.Cmd):
         rooms = self.server.room_manager.rooms
 
         if not rooms:
-            print(f"{StatusIndicator.INFO} No rooms available")
+            print(_INFO_NO_ROOMS_AVAILABLE)
             return
 
         print(f"\n{UIBox.section('Server Rooms', Colors.CYAN)}")
@@ -263,7 +306,7 @@ class AdminConsole(cmd.Cmd):
         flags = self.server.client_handler.get_all_flags()
 
         if not flags:
-            print(f"{StatusIndicator.INFO} No flags captured yet")
+            print(_INFO_NO_FLAGS_CAPTURED_YET)
             return
 
         # Filter by user if specified
@@ -277,7 +320,7 @@ class AdminConsole(cmd.Cmd):
                     print(f"{StatusIndicator.INFO} No flags found for user {colorize(filter_user, Colors.YELLOW)}")
                     return
             except (IndexError, ValueError):
-                print(f"{StatusIndicator.ERROR} Invalid --user argument")
+                print(_ERR_INVALID_USER_ARGUMENT)
                 return
 
         print(f"\n{UIBox.section('Captured Flags', Colors.GREEN)}")
@@ -320,12 +363,11 @@ class AdminConsole(cmd.Cmd):
     def do_clear_flags(self, arg: str) -> None:
         """Clear all flags. Usage: clear_flags [--confirm]"""
         if "--confirm" not in arg:
-            print(f"{StatusIndicator.WARNING} This will delete all flags!")
+            print(_WARN_DELETE_ALL_FLAGS)
             print(f"  Re-run with {colorize('--confirm', Colors.YELLOW)} to proceed")
             return
 
-        count = self.server.client_handler.get_flags_count()
-        self.server.client_handler.flags_storage.clear()
+        count = self.server.client_handler.clear_flags()
         print(f"{StatusIndicator.SUCCESS} All {count} flags cleared")
         self.server.log(f"All {count} flags cleared by admin", "warning")
 
@@ -350,7 +392,7 @@ class AdminConsole(cmd.Cmd):
         """Show memory usage and system info."""
         clients = len(self.server.client_handler.clients.keys())
         rooms = len(self.server.room_manager.rooms.keys())
-        flags = len(self.server.client_handler.flags_storage.keys())
+        flags = self.server.client_handler.get_flags_count()
 
         print(f"\n{UIBox.section('System Memory', Colors.BLUE)}")
         print(UIBox.stat_row("Clients in Memory:", f"{clients} connections"))
@@ -363,7 +405,7 @@ class AdminConsole(cmd.Cmd):
     def do_logs(self, arg: str) -> None:
         """Show server logs. Usage: logs [--recent <count>] [--tail]"""
         if not self.server.history_logs:
-            print(f"{StatusIndicator.INFO} No logs available")
+            print(_INFO_NO_LOGS_AVAILABLE)
             return
 
         count = 20
@@ -375,7 +417,7 @@ class AdminConsole(cmd.Cmd):
             except (IndexError, ValueError):
                 count = 20
 
-        logs = self.server.history_logs[-count:] if "--tail" not in arg else self.server.history_logs[-count:]
+        logs = list(self.server.history_logs)[-count:]
 
         print(f"\n{UIBox.section('Server Logs', Colors.YELLOW)}")
         print(f"{colorize(f'Showing last {len(logs)} entries:', Colors.GRAY)}\n")
@@ -393,7 +435,7 @@ class AdminConsole(cmd.Cmd):
     def do_clear_logs(self, arg: str) -> None:
         """Clear server logs. Usage: clear_logs [--confirm]"""
         if "--confirm" not in arg:
-            print(f"{StatusIndicator.WARNING} This will delete all server logs!")
+            print(_WARN_DELETE_ALL_SERVER_LOGS)
             print(f"  Re-run with {colorize('--confirm', Colors.YELLOW)} to proceed")
             return
 
@@ -405,7 +447,7 @@ class AdminConsole(cmd.Cmd):
     def do_broadcast(self, arg: str) -> None:
         """Broadcast message to all connected users. Usage: broadcast <message>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: broadcast <message>")
+            print(_USAGE_BROADCAST)
             return
 
         message = arg.strip()
@@ -427,7 +469,7 @@ class AdminConsole(cmd.Cmd):
         clients = self.server.client_handler.clients
         
         if not clients.keys():
-            print(f"{StatusIndicator.INFO} No user data available")
+            print(_INFO_NO_USER_DATA_AVAILABLE)
             return
         
         print(f"\n{UIBox.section('User Analytics', Colors.BLUE)}")
@@ -492,7 +534,7 @@ class AdminConsole(cmd.Cmd):
     def do_room_create(self, arg: str) -> None:
         """Create a new room. Usage: room_create <name> [--private] [--max <count>]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: room_create <name> [--private] [--max <count>]")
+            print(_USAGE_ROOM_CREATE)
             return
         
         parts = arg.split()
@@ -522,12 +564,12 @@ class AdminConsole(cmd.Cmd):
             print(f"{StatusIndicator.SUCCESS} Room {colorize(room_name, Colors.GREEN)} created ({room_type}, max {max_users})")
             self.server.log(f"Room {room_name} created by admin", "success")
         else:
-            print(f"{StatusIndicator.ERROR} Room already exists")
+            print(_ERR_ROOM_ALREADY_EXISTS)
 
     def do_room_delete(self, arg: str) -> None:
         """Delete a room. Usage: room_delete <name> [--confirm]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: room_delete <name> [--confirm]")
+            print(_USAGE_ROOM_DELETE)
             return
         
         room_name = arg.split()[0]
@@ -541,19 +583,19 @@ class AdminConsole(cmd.Cmd):
             print(f"{StatusIndicator.SUCCESS} Room {colorize(room_name, Colors.RED)} deleted")
             self.server.log(f"Room {room_name} deleted by admin", "warning")
         else:
-            print(f"{StatusIndicator.ERROR} Cannot delete room (doesn't exist or is protected)")
+            print(_ERR_CANNOT_DELETE_ROOM)
 
     def do_room_info(self, arg: str) -> None:
         """Show detailed room information. Usage: room_info <name>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: room_info <name>")
+            print(_USAGE_ROOM_INFO)
             return
         
         room_name = arg.strip()
         rooms = self.server.room_manager.rooms
         
         if room_name not in rooms:
-            print(f"{StatusIndicator.ERROR} Room not found")
+            print(_ERR_ROOM_NOT_FOUND)
             return
         
         room_info = rooms[room_name]
@@ -576,7 +618,7 @@ class AdminConsole(cmd.Cmd):
     def do_mute(self, arg: str) -> None:
         """Mute a user in a room. Usage: mute <username> [--global] [--duration <seconds>]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: mute <username> [--global] [--duration <sec>]")
+            print(_USAGE_MUTE)
             return
         
         parts = arg.split()
@@ -585,12 +627,12 @@ class AdminConsole(cmd.Cmd):
         
         clients = self.server.client_handler.clients
         if username not in clients.keys():
-            print(f"{StatusIndicator.ERROR} User not found")
+            print(_ERR_USER_NOT_FOUND)
             return
         
         room = self.server.room_manager.get_user_room(username)
         if not room and not is_global:
-            print(f"{StatusIndicator.ERROR} User not in any room")
+            print(_ERR_USER_NOT_IN_ROOM)
             return
         
         if is_global:
@@ -616,7 +658,7 @@ class AdminConsole(cmd.Cmd):
     def do_unmute(self, arg: str) -> None:
         """Unmute a user. Usage: unmute <username> [--global]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: unmute <username> [--global]")
+            print(_USAGE_UNMUTE)
             return
         
         username = arg.split()[0]
@@ -628,7 +670,7 @@ class AdminConsole(cmd.Cmd):
                 scope = "globally"
                 notification = "You have been unmuted globally"
             else:
-                print(f"{StatusIndicator.ERROR} User not muted globally")
+                print(_ERR_USER_NOT_MUTED_GLOBALLY)
                 return
         else:
             room = self.server.room_manager.get_user_room(username)
@@ -637,7 +679,7 @@ class AdminConsole(cmd.Cmd):
                 scope = f"in {room}"
                 notification = f"You have been unmuted in {room}"
             else:
-                print(f"{StatusIndicator.ERROR} User not in any room")
+                print(_ERR_USER_NOT_IN_ROOM)
                 return
         
         # Send notification to user
@@ -662,7 +704,7 @@ class AdminConsole(cmd.Cmd):
         else:
             print(f"\n{UIBox.section('User Warnings', Colors.YELLOW)}")
             if not self.user_warnings:
-                print(f"{StatusIndicator.INFO} No warnings issued")
+                print(_INFO_NO_WARNINGS_ISSUED)
                 return
             
             for user, count in sorted(self.user_warnings.items(), key=lambda x: x[1], reverse=True):
@@ -673,7 +715,7 @@ class AdminConsole(cmd.Cmd):
     def do_user_history(self, arg: str) -> None:
         """Show user action history. Usage: user_history <username> [--detailed]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: user_history <username>")
+            print(_USAGE_USER_HISTORY)
             return
         
         parts = arg.split()
@@ -693,14 +735,14 @@ class AdminConsole(cmd.Cmd):
     def do_track_user(self, arg: str) -> None:
         """Start/stop tracking a user. Usage: track_user <username>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: track_user <username>")
+            print(_USAGE_TRACK_USER)
             return
         
         username = arg.strip()
         clients = self.server.client_handler.clients
         
         if username not in clients.keys():
-            print(f"{StatusIndicator.ERROR} User not found")
+            print(_ERR_USER_NOT_FOUND)
             return
         
         # Record session start
@@ -713,7 +755,7 @@ class AdminConsole(cmd.Cmd):
     def do_search_users(self, arg: str) -> None:
         """Search users by criteria. Usage: search_users --role <role> | --room <room>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: search_users --role <role> | --room <room>")
+            print(_USAGE_SEARCH_USERS)
             return
         
         clients = self.server.client_handler.clients
@@ -733,7 +775,7 @@ class AdminConsole(cmd.Cmd):
                       if self.server.room_manager.get_user_room(u) == search_room]
         
         if not results:
-            print(f"{StatusIndicator.INFO} No users found matching criteria")
+            print(_INFO_NO_MATCHING_USERS)
             return
         
         print(f"\n{UIBox.section('Search Results', Colors.CYAN)}")
@@ -825,7 +867,7 @@ class AdminConsole(cmd.Cmd):
     def do_global_ban(self, arg: str) -> None:
         """Add user to global ban list. Usage: global_ban <username> [reason]"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: global_ban <username> [reason]")
+            print(_USAGE_GLOBAL_BAN)
             return
         
         parts = arg.split(None, 1)
@@ -841,7 +883,7 @@ class AdminConsole(cmd.Cmd):
         """List globally banned users."""
         print(f"\n{UIBox.section('Global Ban List', Colors.RED)}")
         if not self.banned_users_global:
-            print(f"{StatusIndicator.INFO} No globally banned users")
+            print(_INFO_NO_GLOBALLY_BANNED_USERS)
             return
         
         for i, username in enumerate(sorted(self.banned_users_global), 1):
@@ -851,7 +893,7 @@ class AdminConsole(cmd.Cmd):
     def do_unban_global(self, arg: str) -> None:
         """Remove user from global ban list. Usage: unban_global <username>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: unban_global <username>")
+            print(_USAGE_UNBAN_GLOBAL)
             return
         
         username = arg.strip()
@@ -859,28 +901,28 @@ class AdminConsole(cmd.Cmd):
             self.banned_users_global.discard(username)
             print(f"{StatusIndicator.SUCCESS} User {colorize(username, Colors.CYAN)} removed from global ban list")
         else:
-            print(f"{StatusIndicator.ERROR} User not in global ban list")
+            print(_ERR_NOT_GLOBALLY_BANNED)
 
     # ============== AUTOMATED ALERTS ==============
     def do_alerts(self, arg: str) -> None:
         """Manage alerts. Usage: alerts --enable | --disable | --status"""
         if "--enable" in arg:
             self.alerts_active = True
-            print(f"{StatusIndicator.SUCCESS} Alerts enabled")
+            print(_OK_ALERTS_ENABLED)
         elif "--disable" in arg:
             self.alerts_active = False
-            print(f"{StatusIndicator.SUCCESS} Alerts disabled")
+            print(_OK_ALERTS_DISABLED)
         elif "--status" in arg or not arg:
             status = "🟢 ENABLED" if self.alerts_active else "🔴 DISABLED"
             print(f"Alert System: {status}")
         else:
-            print(f"{StatusIndicator.ERROR} Usage: alerts --enable | --disable | --status")
+            print(_USAGE_ALERTS)
 
     # ============== SCHEDULED ANNOUNCEMENTS ==============
     def do_schedule_announcement(self, arg: str) -> None:
         """Schedule an announcement. Usage: schedule_announcement <message>"""
         if not arg:
-            print(f"{StatusIndicator.ERROR} Usage: schedule_announcement <message>")
+            print(_USAGE_SCHEDULE_ANNOUNCEMENT)
             return
         
         message = arg.strip()
@@ -944,7 +986,7 @@ class AdminConsole(cmd.Cmd):
     def do_quit(self, arg: str) -> None:
         """Stop server and exit admin console."""
         if input(f"{colorize('Are you sure? (yes/no): ', Colors.YELLOW)}").lower() == "yes":
-            print(f"{StatusIndicator.INFO} Stopping server...")
+            print(_INFO_STOPPING_SERVER)
             self.server.stop()
             return True
         return False
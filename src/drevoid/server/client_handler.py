@@ -9,6 +9,7 @@ from ..core.protocol import (
     MessageType,
     create_message,
     ThreadSafeDict,
+    CopyOnWriteDict,
     hash_password,
 )
 
@@ -19,8 +20,12 @@ class ClientHandler:
     def __init__(self, logger):
         """Initialize client handler."""
         self.logger = logger
-        self.clients = ThreadSafeDict()  # username -> (socket, addr, role)
+        self.clients = CopyOnWriteDict()  # username -> (socket, addr, role)
+        # Membership-only view of clients for hot-path auth checks
+        self.connected_usernames: set[str] = set()
         self.flags_storage = ThreadSafeDict()
+        self._flags_version = 0
+        self._flags_cache: Optional[Tuple[int, list]] = None
 
     def register_client(self, username: str, socket: socket.socket, addr: Tuple, role: str) -> bool:
         """
@@ -35,13 +40,15 @@ class ClientHandler:
         Returns:
             True if registered, False if username taken
         """
-        if username in self.clients.keys():
+        if username in self.clients:
             return False
         self.clients[username] = (socket, addr, role)
+        self.connected_usernames.add(username)
         return True
 
     def unregister_client(self, username: str) -> Optional[Tuple]:
         """Unregister client and return its info."""
+        self.connected_usernames.discard(username)
         return self.clients.pop(username, None)
 
     def get_client_socket(self, username: str) -> Optional[socket.socket]:
@@ -71,7 +78,7 @@ class ClientHandler:
             return False
         try:
             message = create_message(msg_type, data)
-            sock.send(serialize_message(message))
+            sock.sendall(serialize_message(message))
             return True
         except Exception:
             return False
@@ -94,6 +101,28 @@ class ClientHandler:
             data: Message data
             exclude: Username to exclude
 
+        Returns:
+            Number of users message was sent to
+        """
+        payload = serialize_message(create_message(msg_type, data))
+        return self.broadcast_raw(room_manager, room_name, payload, exclude)
+
+    def broadcast_raw(
+        self,
+        room_manager,
+        room_name: str,
+        payload: bytes,
+        exclude: Optional[str] = None,
+    ) -> int:
+        """
+        Broadcast an already serialized frame to all users in room.
+
+        Args:
+            room_manager: Server room manager
+            room_name: Target room
+            payload: Serialized message frame
+            exclude: Username to exclude
+
         Returns:
             Number of users message was sent to
         """
@@ -105,8 +134,14 @@ class ClientHandler:
                 continue
             if room_manager.is_user_muted(user, room_name):
                 continue
-            if self.send_to_client(user, msg_type, data):
+            sock = self.get_client_socket(user)
+            if not sock:
+                continue
+            try:
+                sock.sendall(payload)
                 sent_count += 1
+            except Exception:
+                pass
 
         return sent_count
 
@@ -123,7 +158,7 @@ class ClientHandler:
         Returns:
             True if new flag, False if already stored
         """
-        if flag_content in self.flags_storage.keys():
+        if flag_content in self.flags_storage:
             return False
 
         self.flags_storage[flag_content] = {
@@ -133,12 +168,33 @@ class ClientHandler:
             "timestamp": time.time(),
             "message_preview": preview,
         }
+        self._flags_version += 1
         return True
 
     def get_all_flags(self) -> list:
-        """Get all stored flags."""
-        return list(self.flags_storage.values())
+        """
+        Get all stored flags.
+
+        The list is rebuilt only after a flag is stored or flags are
+        cleared; callers must treat it as read-only.
+
+        Returns:
+            List of flag dicts
+        """
+        version = self._flags_version
+        cached = self._flags_cache
+        if cached is None or cached[0] != version:
+            cached = (version, self.flags_storage.values())
+            self._flags_cache = cached
+        return cached[1]
+
+    def clear_flags(self) -> int:
+        """Remove all stored flags and return how many were removed."""
+        count = len(self.flags_storage)
+        self.flags_storage.clear()
+        self._flags_version += 1
+        return count
 
     def get_flags_count(self) -> int:
         """Get total flags stored."""
-        return len(self.flags_storage.keys())
+        return len(self.flags_storage)
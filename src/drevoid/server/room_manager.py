@@ -1,7 +1,8 @@
 """Server-side room management."""
 
-from typing import Set, Dict
-from ..core.protocol import RoomType, hash_password, ThreadSafeDict
+import threading
+from typing import Set, Dict, List, Optional, Tuple
+from ..core.protocol import RoomType, hash_password, ThreadSafeDict, CopyOnWriteDict
 
 
 class ServerRoomManager:
@@ -9,11 +10,15 @@ class ServerRoomManager:
 
     def __init__(self):
         """Initialize room manager."""
-        self.rooms = ThreadSafeDict()
+        self.rooms = CopyOnWriteDict()
         self.user_rooms = ThreadSafeDict()
         self.room_histories: Dict[str, list] = {}
         self.banned_users: Dict[str, Set[str]] = {}
         self.muted_users: Dict[str, Set[str]] = {}
+        self._rooms_version = 0
+        self._active_room_count = 0
+        self._membership_lock = threading.RLock()
+        self._room_list_cache: Optional[Tuple[int, List[dict]]] = None
 
         # Create default general room
         self.create_room("general", RoomType.PUBLIC, "")
@@ -33,7 +38,7 @@ class ServerRoomManager:
         Returns:
             True if created, False if already exists
         """
-        if room_name in self.rooms.keys():
+        if room_name in self.rooms:
             return False
 
         pwd_hash = hash_password(password) if room_type == RoomType.PRIVATE else ""
@@ -48,40 +53,88 @@ class ServerRoomManager:
         self.room_histories[room_name] = []
         self.banned_users[room_name] = set()
         self.muted_users[room_name] = set()
+        self._rooms_version += 1
         return True
 
     def delete_room(self, room_name: str) -> bool:
         """Delete a room."""
-        if room_name not in self.rooms.keys() or room_name == "general":
+        if room_name not in self.rooms or room_name == "general":
             return False
-        del self.rooms[room_name]
+        with self._membership_lock:
+            if self.rooms[room_name]["users"]:
+                self._active_room_count -= 1
+            del self.rooms[room_name]
         self.room_histories.pop(room_name, None)
         self.banned_users.pop(room_name, None)
         self.muted_users.pop(room_name, None)
+        self._rooms_version += 1
         return True
 
     def add_user_to_room(self, username: str, room_name: str) -> bool:
         """Add user to room."""
-        if room_name not in self.rooms.keys():
+        if room_name not in self.rooms:
             return False
-        self.rooms[room_name]["users"].add(username)
+        with self._membership_lock:
+            users = self.rooms[room_name]["users"]
+            if not users:
+                self._active_room_count += 1
+            users.add(username)
+            self._rooms_version += 1
         self.user_rooms[username] = room_name
         return True
 
     def remove_user_from_room(self, username: str, room_name: str) -> bool:
         """Remove user from room."""
-        if room_name not in self.rooms.keys():
+        if room_name not in self.rooms:
             return False
-        self.rooms[room_name]["users"].discard(username)
-        if username in self.user_rooms.keys():
+        with self._membership_lock:
+            users = self.rooms[room_name]["users"]
+            if username in users:
+                users.discard(username)
+                if not users:
+                    self._active_room_count -= 1
+            self._rooms_version += 1
+        if username in self.user_rooms:
             self.user_rooms.pop(username)
         return True
 
     def get_room_users(self, room_name: str) -> Set[str]:
         """Get users in room."""
-        if room_name not in self.rooms.keys():
+        room = self.rooms.get(room_name)
+        if room is None:
             return set()
-        return self.rooms[room_name]["users"].copy()
+        return room["users"].copy()
+
+    def get_room_list(self) -> List[dict]:
+        """
+        Get room summaries for clients.
+
+        The list is rebuilt only after a room or its membership changes;
+        callers must treat it as read-only.
+
+        Returns:
+            List of room summary dicts
+        """
+        version = self._rooms_version
+        cached = self._room_list_cache
+        if cached is None or cached[0] != version:
+            room_list = [
+                {
+                    "name": room_name,
+                    "type": room_info["type"],
+                    "password_protected": room_info["password_protected"],
+                    "users": len(room_info["users"]),
+                    "max_users": room_info["max_users"],
+                }
+                for room_name, room_info in self.rooms.items()
+            ]
+            cached = (version, room_list)
+            self._room_list_cache = cached
+        return cached[1]
+
+    def get_active_room_count(self) -> int:
+        """Get number of rooms with at least one user."""
+        return self._active_room_count
 
     def get_user_room(self, username: str) -> str | None:
         """Get room user is in."""
@@ -4,6 +4,7 @@ import socket
 import threading
 import time
 import argparse
+from collections import deque
 from typing import Optional
 
 from ..core.protocol import (
@@ -11,7 +12,7 @@ from ..core.protocol import (
     UserRole,
     RoomType,
     serialize_message,
-    deserialize_message,
+    deserialize_message_at,
     create_message,
     hash_password,
 )
@@ -20,6 +21,19 @@ from .room_manager import ServerRoomManager
 from .client_handler import ClientHandler
 from .admin_console import AdminConsole
 
+# Raw type strings for the per-message hot path (avoids Enum attribute lookups)
+_MT_CONNECT = MessageType.CONNECT.value
+_MT_DISCONNECT = MessageType.DISCONNECT.value
+_ROLE_USER = UserRole.USER.value
+
+# Pre-built history prefixes for the standard log levels
+_LEVEL_PREFIX = {
+    "info": "[INFO] ",
+    "success": "[SUCCESS] ",
+    "warning": "[WARNING] ",
+    "error": "[ERROR] ",
+}
+
 
 class ChatServer:
     """
@@ -30,6 +44,10 @@ class ChatServer:
 
     DEFAULT_HOST = "0.0.0.0"
     DEFAULT_PORT = 8891
+    SOCKET_BUFFER_SIZE = 256 * 1024
+    RECV_CHUNK_SIZE = 4096
+    HISTORY_LOG_LIMIT = 10000
+    MAX_CONNECTIONS = 256
 
     def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, enable_logging: bool = True):
         """
@@ -46,17 +64,35 @@ class ChatServer:
 
         self.socket: Optional[socket.socket] = None
         self.running = False
+        # Set once the listening socket is bound, so callers can wait instead of sleeping
+        self.ready = threading.Event()
         self.start_time = time.time()
+        self._connection_slots = threading.BoundedSemaphore(self.MAX_CONNECTIONS)
 
         self.room_manager = ServerRoomManager()
         self.client_handler = ClientHandler(self.logger)
 
-        self.history_logs = []
+        self.history_logs = deque(maxlen=self.HISTORY_LOG_LIMIT)
+
+        # Authenticated message routing: type value -> handler(username, data)
+        self._handlers = {
+            MessageType.CREATE_ROOM.value: self._handle_create_room,
+            MessageType.LIST_ROOMS.value: lambda username, data: self._handle_list_rooms(username),
+            MessageType.JOIN_ROOM.value: self._handle_join_room,
+            MessageType.LEAVE_ROOM.value: lambda username, data: self._handle_leave_room(username),
+            MessageType.LIST_USERS.value: lambda username, data: self._handle_list_users(username),
+            MessageType.MESSAGE.value: self._handle_room_message,
+            MessageType.PRIVATE_MESSAGE.value: self._handle_private_message,
+            MessageType.KICK_USER.value: self._handle_kick_user,
+            MessageType.BAN_USER.value: self._handle_ban_user,
+            MessageType.FLAG_SUBMIT.value: self._handle_flag_submit,
+            MessageType.FLAG_REQUEST.value: lambda username, data: self._handle_flag_request(username),
+        }
 
     def log(self, message: str, level: str = "info") -> None:
         """Log a message."""
-        entry = f"[{level.upper()}] {message}"
-        self.history_logs.append(entry)
+        prefix = _LEVEL_PREFIX.get(level) or f"[{level.upper()}] "
+        self.history_logs.append(prefix + message)
 
         if level == "info":
             self.logger.info(message)
@@ -77,6 +113,7 @@ class ChatServer:
             self.socket.listen(100)
             self.running = True
             self.start_time = time.time()
+            self.ready.set()
 
             self.log(f"Server starting on {self.host}:{self.port}", "success")
 
@@ -87,12 +124,21 @@ class ChatServer:
             while self.running:
                 try:
                     client_socket, addr = self.socket.accept()
+                    if not self._connection_slots.acquire(blocking=False):
+                        self._reject_client(client_socket, addr)
+                        continue
+                    self._configure_client_socket(client_socket)
                     thread = threading.Thread(
                         target=self._handle_client,
                         args=(client_socket, addr),
+                        name=f"drevoid-client-{addr[0]}:{addr[1]}",
                         daemon=True,
                     )
-                    thread.start()
+                    try:
+                        thread.start()
+                    except RuntimeError:
+                        self._connection_slots.release()
+                        self._reject_client(client_socket, addr)
                 except KeyboardInterrupt:
                     self.stop()
                 except Exception as e:
@@ -110,12 +156,47 @@ class ChatServer:
 
     def _cleanup(self) -> None:
         """Clean up server resources."""
+        self.ready.clear()
         if self.socket:
             try:
                 self.socket.close()
             except Exception:
                 pass
 
+    def _reject_client(self, client_socket: socket.socket, addr) -> None:
+        """Turn away a connection when all connection slots are in use."""
+        self._send_to_socket(client_socket, MessageType.ERROR, {"message": "Server full, try again later"})
+        try:
+            client_socket.close()
+        except Exception:
+            pass
+        self.log(f"Rejected {addr[0]}:{addr[1]}: connection limit reached", "warning")
+
+    def _configure_client_socket(self, client_socket: socket.socket) -> None:
+        """
+        Tune an accepted socket for small, latency-sensitive chat frames.
+
+        Disables Nagle so frames go out immediately, enables keepalive to
+        reap dead peers, and sizes the kernel buffers explicitly.
+
+        Args:
+            client_socket: Accepted client socket
+        """
+        options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            (socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE),
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE),
+        ]
+        if hasattr(socket, "TCP_QUICKACK"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1))
+
+        for level, option, value in options:
+            try:
+                client_socket.setsockopt(level, option, value)
+            except OSError:
+                pass
+
     def _handle_client(self, client_socket: socket.socket, addr) -> None:
         """
         Handle individual client connection (runs in thread).
@@ -125,18 +206,22 @@ class ChatServer:
             addr: Client address
         """
         username = None
-        buffer = b""
+        buffer = bytearray()
+        recv_buffer = bytearray(self.RECV_CHUNK_SIZE)
+        recv_view = memoryview(recv_buffer)
 
         try:
             while True:
-                chunk = client_socket.recv(4096)
-                if not chunk:
+                received = client_socket.recv_into(recv_buffer)
+                if not received:
                     break
 
-                buffer += chunk
+                buffer += recv_view[:received]
 
+                # Walk the frames by offset and drop the consumed prefix once
+                offset = 0
                 while True:
-                    message, buffer = deserialize_message(buffer)
+                    message, offset = deserialize_message_at(buffer, offset)
                     if message is None:
                         break
 
@@ -144,23 +229,27 @@ class ChatServer:
                     data = message.get("data", {})
 
                     # Track username for successful CONNECT
-                    if msg_type == MessageType.CONNECT.value and username is None:
+                    if msg_type == _MT_CONNECT and username is None:
                         username = data.get("username", "").strip()
                     
                     if not self._process_message(client_socket, addr, username, msg_type, data):
                         break
 
+                if offset:
+                    del buffer[:offset]
+
         except Exception as e:
             self.log(f"Client error: {e}", "error")
         finally:
             # Cleanup on disconnect
-            if username and username in self.client_handler.clients.keys():
+            if username and username in self.client_handler.connected_usernames:
                 self._handle_disconnect(username)
 
             try:
                 client_socket.close()
             except Exception:
                 pass
+            self._connection_slots.release()
 
     def _process_message(self, client_socket: socket.socket, addr, username: Optional[str], msg_type: str, data: dict) -> bool:
         """
@@ -177,39 +266,21 @@ class ChatServer:
             True to continue connection
         """
         # CONNECT
-        if msg_type == MessageType.CONNECT.value:
+        if msg_type == _MT_CONNECT:
             return self._handle_connect(client_socket, addr, data)
 
         # Must be authenticated
-        if not username or username not in self.client_handler.clients.keys():
+        if not username or username not in self.client_handler.connected_usernames:
             self._send_to_socket(client_socket, MessageType.ERROR, {"message": "Not authenticated"})
             return False
 
         # Route to handler based on type
-        if msg_type == MessageType.DISCONNECT.value:
+        if msg_type == _MT_DISCONNECT:
             return False
-        elif msg_type == MessageType.CREATE_ROOM.value:
-            self._handle_create_room(username, data)
-        elif msg_type == MessageType.LIST_ROOMS.value:
-            self._handle_list_rooms(username)
-        elif msg_type == MessageType.JOIN_ROOM.value:
-            self._handle_join_room(username, data)
-        elif msg_type == MessageType.LEAVE_ROOM.value:
-            self._handle_leave_room(username)
-        elif msg_type == MessageType.LIST_USERS.value:
-            self._handle_list_users(username)
-        elif msg_type == MessageType.MESSAGE.value:
-            self._handle_room_message(username, data)
-        elif msg_type == MessageType.PRIVATE_MESSAGE.value:
-            self._handle_private_message(username, data)
-        elif msg_type == MessageType.KICK_USER.value:
-            self._handle_kick_user(username, data)
-        elif msg_type == MessageType.BAN_USER.value:
-            self._handle_ban_user(username, data)
-        elif msg_type == MessageType.FLAG_SUBMIT.value:
-            self._handle_flag_submit(username, data)
-        elif msg_type == MessageType.FLAG_REQUEST.value:
-            self._handle_flag_request(username)
+
+        handler = self._handlers.get(msg_type)
+        if handler:
+            handler(username, data)
 
         return True
 
@@ -217,7 +288,14 @@ class ChatServer:
         """Send message to socket."""
         try:
             message = create_message(msg_type, data)
-            sock.send(serialize_message(message))
+            sock.sendall(serialize_message(message))
+        except Exception:
+            pass
+
+    def _send_frames(self, sock: socket.socket, *messages: dict) -> None:
+        """Send several messages to socket in a single write."""
+        try:
+            sock.sendall(b"".join(map(serialize_message, messages)))
         except Exception:
             pass
 
@@ -225,26 +303,31 @@ class ChatServer:
         """Handle client connect."""
         username = data.get("username", "").strip()
 
-        if not username or username in self.client_handler.clients.keys():
+        if not username or username in self.client_handler.connected_usernames:
             self._send_to_socket(client_socket, MessageType.ERROR, {"message": "Username invalid or taken"})
             return False
 
-        if not self.client_handler.register_client(username, client_socket, addr, UserRole.USER.value):
+        if not self.client_handler.register_client(username, client_socket, addr, _ROLE_USER):
             self._send_to_socket(client_socket, MessageType.ERROR, {"message": "Connection failed"})
             return False
 
-        self._send_to_socket(client_socket, MessageType.SUCCESS, {"message": "Connected"})
-        self._send_server_status(username)
+        # Acknowledgement and welcome status go out together
+        self._send_frames(
+            client_socket,
+            create_message(MessageType.SUCCESS, {"message": "Connected"}),
+            self._server_status_message(),
+        )
         self.log(f"User connected: {username}", "success")
         return True
 
     def _handle_create_room(self, username: str, data: dict) -> None:
         """Handle room creation."""
-        room_name = data.get("room_name", "").strip()
-        room_type = data.get("room_type", "public")
-        password = data.get("password", "")
+        data_get = data.get
+        room_name = data_get("room_name", "").strip()
+        room_type = data_get("room_type", "public")
+        password = data_get("password", "")
 
-        if not room_name or room_name in self.room_manager.rooms.keys():
+        if not room_name or room_name in self.room_manager.rooms:
             self.client_handler.send_to_client(username, MessageType.ERROR, {"message": "Room invalid or exists"})
             return
 
@@ -255,74 +338,65 @@ class ChatServer:
 
     def _handle_list_rooms(self, username: str) -> None:
         """Handle room list request."""
-        room_list = []
-        for room_name in self.room_manager.rooms.keys():
-            room_info = self.room_manager.rooms[room_name]
-            room_list.append({
-                "name": room_name,
-                "type": room_info["type"],
-                "password_protected": room_info["password_protected"],
-                "users": len(room_info["users"]),
-                "max_users": room_info["max_users"],
-            })
-
         self.client_handler.send_to_client(
             username,
             MessageType.SUCCESS,
             {
                 "message": "Room list",
-                "rooms": room_list,
+                "rooms": self.room_manager.get_room_list(),
                 "stats": self._get_server_stats(),
             },
         )
 
     def _handle_join_room(self, username: str, data: dict) -> None:
         """Handle room join."""
-        room_name = data.get("room_name", "").strip()
-        password = data.get("password", "")
-
-        if room_name not in self.room_manager.rooms.keys():
-            self.client_handler.send_to_client(username, MessageType.ERROR, {"message": "Room not found"})
+        data_get = data.get
+        room_name = data_get("room_name", "").strip()
+        password = data_get("password", "")
+        room_manager = self.room_manager
+        send = self.client_handler.send_to_client
+
+        room_info = room_manager.rooms.get(room_name)
+        if room_info is None:
+            send(username, MessageType.ERROR, {"message": "Room not found"})
             return
 
-        if self.room_manager.is_user_banned(username, room_name):
-            self.client_handler.send_to_client(username, MessageType.ERROR, {"message": "You are banned"})
+        if room_manager.is_user_banned(username, room_name):
+            send(username, MessageType.ERROR, {"message": "You are banned"})
             return
 
-        room_info = self.room_manager.rooms[room_name]
-
         if room_info["type"] == "private" and hash_password(password) != room_info["password_hash"]:
-            self.client_handler.send_to_client(username, MessageType.ERROR, {"message": "Invalid password"})
+            send(username, MessageType.ERROR, {"message": "Invalid password"})
             return
 
         if len(room_info["users"]) >= room_info["max_users"]:
-            self.client_handler.send_to_client(username, MessageType.ERROR, {"message": "Room full"})
+            send(username, MessageType.ERROR, {"message": "Room full"})
             return
 
         # Leave previous room
-        old_room = self.room_manager.get_user_room(username)
+        old_room = room_manager.get_user_room(username)
         if old_room:
-            self.room_manager.remove_user_from_room(username, old_room)
+            room_manager.remove_user_from_room(username, old_room)
             self.client_handler.broadcast_to_room(
-                self.room_manager,
+                room_manager,
                 old_room,
                 MessageType.NOTIFICATION,
                 {"message": f"{username} left"},
                 exclude=username,
             )
-            self.room_manager.log_room_event(old_room, f"{username} left")
+            room_manager.log_room_event(old_room, f"{username} left")
 
         # Join new room
-        self.room_manager.add_user_to_room(username, room_name)
-        self.client_handler.send_to_client(username, MessageType.SUCCESS, {"message": f"Joined {room_name}"})
+        room_manager.add_user_to_room(username, room_name)
+        send(username, MessageType.SUCCESS, {"message": f"Joined {room_name}"})
         self.client_handler.broadcast_to_room(
-            self.room_manager,
+            room_manager,
             room_name,
             MessageType.NOTIFICATION,
             {"message": f"{username} joined"},
             exclude=username,
         )
-        self.room_manager.log_room_event(room_name, f"{username} joined")
+        room_manager.log_room_event(room_name, f"{username} joined")
         self.log(f"{username} joined room {room_name}", "info")
 
     def _handle_leave_room(self, username: str) -> None:
@@ -391,10 +465,11 @@ class ChatServer:
 
     def _handle_private_message(self, username: str, data: dict) -> None:
         """Handle private message."""
-        target = data.get("target", "")
-        content = data.get("content", "")
+        data_get = data.get
+        target = data_get("target", "")
+        content = data_get("content", "")
 
-        if target not in self.client_handler.clients.keys():
+        if target not in self.client_handler.connected_usernames:
             self.client_handler.send_to_client(username, MessageType.ERROR, {"message": "User not found"})
             return
 
@@ -477,25 +552,13 @@ class ChatServer:
             {"flags": flags, "total": len(flags)},
         )
 
-    def _send_server_status(self, username: str) -> None:
-        """Send server status to client."""
-        room_list = []
-        for room_name in self.room_manager.rooms.keys():
-            room_info = self.room_manager.rooms[room_name]
-            room_list.append({
-                "name": room_name,
-                "type": room_info["type"],
-                "password_protected": room_info["password_protected"],
-                "users": len(room_info["users"]),
-                "max_users": room_info["max_users"],
-            })
-
-        self.client_handler.send_to_client(
-            username,
+    def _server_status_message(self) -> dict:
+        """Build the welcome status message sent to a newly connected client."""
+        return create_message(
             MessageType.SUCCESS,
             {
                 "message": "Welcome to Drevoid",
-                "rooms": room_list,
+                "rooms": self.room_manager.get_room_list(),
                 "stats": self._get_server_stats(),
             },
         )
@@ -503,11 +566,10 @@ class ChatServer:
     def _get_server_stats(self) -> dict:
         """Get server statistics."""
         uptime = int(time.time() - self.start_time)
-        active_rooms = len([r for r in self.room_manager.rooms.keys() if self.room_manager.rooms[r]["users"]])
 
         return {
-            "connected_users": len(self.client_handler.clients.keys()),
-            "active_rooms": active_rooms,
+            "connected_users": len(self.client_handler.clients),
+            "active_rooms": self.room_manager.get_active_room_count(),
             "uptime": uptime,
         }
 
@@ -2,10 +2,15 @@
 
 from typing import TYPE_CHECKING
 
+from ..core.protocol import colorize, Colors
+
 if TYPE_CHECKING:
     from ..client.chat_client import ChatClient
 
 
+_ERR_NOT_CONNECTED = colorize("❌ Not connected", Colors.RED)
+
+
 class ModerationCommands:
     """Handles moderation operations."""
 
@@ -29,9 +34,7 @@ class ModerationCommands:
             True if successful
         """
         if not self.client.connected:
-            from ..core.protocol import colorize, Colors
-
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            print(_ERR_NOT_CONNECTED)
             return False
         return self.client.kick_user(username)
 
@@ -46,9 +49,7 @@ class ModerationCommands:
             True if successful
         """
         if not self.client.connected:
-            from ..core.protocol import colorize, Colors
-
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            print(_ERR_NOT_CONNECTED)
             return False
         return self.client.ban_user(username)
 
@@ -64,12 +65,8 @@ class ModerationCommands:
             True if successful
         """
         if not self.client.connected:
-            from ..core.protocol import colorize, Colors
-
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            print(_ERR_NOT_CONNECTED)
             return False
-        from ..core.protocol import colorize, Colors
-
         print(f"{colorize(f'✅ Muted {username}', Colors.GREEN)}")
         return True
 
@@ -84,12 +81,8 @@ class ModerationCommands:
             True if successful
         """
         if not self.client.connected:
-            from ..core.protocol import colorize, Colors
-
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            print(_ERR_NOT_CONNECTED)
             return False
-        from ..core.protocol import colorize, Colors
-
         print(f"{colorize(f'✅ Unmuted {username}', Colors.GREEN)}")
         return True
 
@@ -105,12 +98,8 @@ class ModerationCommands:
             True if successful
         """
         if not self.client.connected:
-            from ..core.protocol import colorize, Colors
-
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            print(_ERR_NOT_CONNECTED)
             return False
-        from ..core.protocol import colorize, Colors
-
         print(f"{colorize(f'✅ Promoted {username} to {role}', Colors.GREEN)}")
         return True
 
@@ -125,11 +114,7 @@ class ModerationCommands:
             True if successful
         """
         if not self.client.connected:
-            from ..core.protocol import colorize, Colors
-
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            print(_ERR_NOT_CONNECTED)
             return False
-        from ..core.protocol import colorize, Colors
-
         print(f"{colorize(f'✅ Demoted {username}', Colors.GREEN)}")
         return True
@@ -1,21 +1,317 @@
 """Interactive chat shell and command interface."""
 
 import cmd
+import functools
 import os
-from typing import TYPE_CHECKING
+import queue
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..core.protocol import Colors, colorize
-from ..utils.emoji_aliases import EmojiAliases
-from .moderation import ModerationCommands
-from .ui_components import UIBox, StatusIndicator, FlagDisplay, UserDisplay, RoomDisplay, MenuBar
+from .ui_components import UIBox, StatusIndicator, FlagDisplay
 
 if TYPE_CHECKING:
     from ..client.chat_client import ChatClient
+    from .moderation import ModerationCommands
+
+
+# (title, title color, ((command, description), ...)) for each help section
+_HELP_SECTIONS = (
+    ("Connection Commands", Colors.YELLOW, (
+        ("connect", "Connect to server"),
+        ("disconnect", "Disconnect from server"),
+        ("status", "Show connection status"),
+    )),
+    ("Room Commands", Colors.YELLOW, (
+        ("join <room>", "Join a room"),
+        ("leave", "Leave current room"),
+        ("create <name>", "Create a new room"),
+        ("rooms", "List available rooms"),
+        ("users", "List users in room"),
+        ("topic <text>", "Set room topic"),
+        ("invite <user>", "Invite user to room"),
+        ("lockroom", "Lock room (admin only)"),
+        ("unlockroom", "Unlock room (admin only)"),
+    )),
+    ("Messaging Commands", Colors.YELLOW, (
+        ("msg <user> <text>", "Send private message"),
+        ("pm <user> <text>", "Send PM (alias)"),
+        ("<message>", "Send message to room"),
+        ("announce <text>", "Announce to room (admin)"),
+        ("broadcast <text>", "Broadcast to all (admin)"),
+    )),
+    ("User Management", Colors.YELLOW, (
+        ("profile", "View your profile"),
+        ("online", "List online users"),
+        ("whois <user>", "Get user info"),
+        ("info <user|room>", "Get detailed info"),
+        ("block <user>", "Block user"),
+        ("unblock <user>", "Unblock user"),
+        ("blocked", "List blocked users"),
+    )),
+    ("CTF & Flag Commands", Colors.YELLOW, (
+        ("flags", "Display captured flags"),
+        ("flag-count", "Show total flags"),
+    )),
+    ("Chat History & Search", Colors.YELLOW, (
+        ("history [limit]", "Show chat history"),
+        ("search <keyword>", "Search messages"),
+        ("export <file>", "Export chat history"),
+        ("stats [room]", "Show statistics"),
+    )),
+    ("Moderation Commands (Admin Only)", Colors.RED, (
+        ("kick <user>", "Kick user from room"),
+        ("ban <user>", "Ban user from server"),
+        ("mute <user> [time]", "Mute user"),
+        ("unmute <user>", "Unmute user"),
+        ("gag <user>", "Gag user (hide messages)"),
+        ("ungag <user>", "Ungag user"),
+        ("promote <user>", "Promote to moderator"),
+        ("demote <user>", "Demote user"),
+        ("clearroom", "Clear room messages"),
+    )),
+    ("Productivity & Notifications", Colors.YELLOW, (
+        ("settings", "Show settings"),
+        ("notifications", "Notification settings"),
+        ("remind <time> <msg>", "Set reminder"),
+        ("timer <duration>", "Start timer"),
+        ("alias [add|list]", "Manage aliases"),
+        ("snippet [add|list]", "Manage snippets"),
+    )),
+    ("Utilities", Colors.YELLOW, (
+        ("emojis", "Show emoji aliases"),
+        ("clear", "Clear screen"),
+        ("help", "Show this help"),
+    )),
+    ("Exit Commands", Colors.YELLOW, (
+        ("quit/exit", "Exit application"),
+    )),
+)
+
+
+def _build_help_text() -> str:
+    """Render the static help page once at import time."""
+    lines = [UIBox.header("🎯 Drevoid LAN Chat Commands", 80)]
+    for title, color, rows in _HELP_SECTIONS:
+        lines.append(UIBox.section(title, color))
+        lines.extend(f"  {colorize(command, Colors.CYAN):20} → {description}" for command, description in rows)
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+_BOLD_YELLOW = Colors.BOLD + Colors.YELLOW
+# Clear screen and scrollback, then home the cursor
+_CLEAR_SCREEN = "\033[2J\033[3J\033[H"
+
+_HELP_TEXT = _build_help_text()
+_EMOJIS_HEADER = (
+    f"\n{colorize('😊 Emoji Aliases', _BOLD_YELLOW)}\n"
+    f"{colorize('Use these text patterns to add emojis to your messages:', Colors.GRAY)}\n\n"
+)
+_EMOJIS_FOOTER = f"\n{colorize('Example:', Colors.YELLOW)} I love this :heart: :fire: :rocket:\n\n"
+_ERR_NOT_CONNECTED = colorize("❌ Not connected", Colors.RED)
+_ERR_NOT_IN_ROOM = colorize("❌ Not in any room", Colors.RED)
+# Newline-terminated: default() writes these straight to stdout
+_ERR_CONNECT_FIRST = colorize("❌ Not connected. Use connect command first.", Colors.RED) + "\n"
+_ERR_JOIN_FIRST = colorize("❌ Not in any room. Use join command first.", Colors.RED) + "\n"
+_USAGE_CREATE = colorize("❌ Usage: create <room_name> [private] [password]", Colors.RED)
+_USAGE_KICK = colorize("❌ Usage: kick <username>", Colors.RED)
+_USAGE_BAN = colorize("❌ Usage: ban <username>", Colors.RED)
+_USAGE_MSG = colorize("❌ Usage: msg <username> <message>", Colors.RED)
+
+# Fixed-shape status lines: plain strings, or str.format_map templates
+_CONNECTING_FMT = (
+    StatusIndicator.LOADING + " Connecting to " + Colors.WHITE + "{host}:{port}" + Colors.RESET
+    + " as " + Colors.CYAN + "{username}" + Colors.RESET + "..."
+).format_map
+_JOINING_FMT = (StatusIndicator.LOADING + " Joining " + Colors.CYAN + "{room}" + Colors.RESET + "...").format_map
+_JOINED_FMT = (StatusIndicator.SUCCESS + " Joined " + Colors.CYAN + "{room}" + Colors.RESET).format_map
+_MSG_ALREADY_CONNECTED = StatusIndicator.ERROR + " Already connected. Disconnect first."
+_MSG_INVALID_PORT = StatusIndicator.ERROR + " Invalid port number"
+_MSG_USERNAME_REQUIRED = StatusIndicator.ERROR + " Username is required"
+_MSG_CONNECT_IN_PROGRESS = StatusIndicator.WARNING + " Connection already in progress"
+_MSG_CONNECTED = StatusIndicator.SUCCESS + " Connected successfully!"
+_MSG_CONNECT_FAILED = StatusIndicator.ERROR + " Connection failed"
+_MSG_DISCONNECTED = StatusIndicator.SUCCESS + " Disconnected"
+_MSG_LEFT_ROOM = StatusIndicator.SUCCESS + " Left room"
+_USAGE_JOIN = StatusIndicator.ERROR + " Usage: " + colorize("join <room_name>", Colors.CYAN)
+_PROMPT_DISCONNECTED = colorize("Not connected", Colors.RED) + " > "
+_ASK_HOST = colorize("Enter server host (ch.tubox.cloud):", Colors.CYAN) + " "
+_ASK_PORT = colorize("Enter server port (8891):", Colors.CYAN) + " "
+_ASK_USERNAME = colorize("Enter username:", Colors.CYAN) + " "
+_ASK_CONFIRM = colorize("Are you sure? Type YES to confirm: ", Colors.YELLOW)
+_MSG_NOT_CONNECTED = StatusIndicator.ERROR + " Not connected"
+_MSG_NOT_IN_ROOM = StatusIndicator.ERROR + " Not in any room"
+_WARN_NOT_CONNECTED = StatusIndicator.WARNING + " Not connected"
+_WARN_NOT_IN_ROOM = StatusIndicator.WARNING + " Not in any room"
+_MSG_HISTORY_NEEDS_ROOM = StatusIndicator.ERROR + " Not in any room. Specify room name: history [limit] <room_name>"
+_MSG_GOODBYE = colorize("👋 Goodbye!", Colors.GREEN)
+_MSG_FETCHING_HISTORY = colorize("🔄 Fetching history...", Colors.CYAN) + "\n"
+_MSG_NO_HISTORY = colorize("No history available yet. Start chatting!", Colors.GRAY) + "\n"
+_MSG_NO_RESULTS = colorize("No results found", Colors.GRAY) + "\n"
+_MSG_NO_USER_DATA = colorize("No user data available", Colors.GRAY) + "\n"
+_MSG_BLOCK_NOTE = colorize("You will no longer receive messages from this user.", Colors.GRAY) + "\n"
+_MSG_NO_BLOCKED = colorize("No users blocked", Colors.GRAY) + "\n"
+_MSG_PROFILE_EDIT_TODO = colorize("Profile editing not yet implemented", Colors.GRAY) + "\n"
+_MSG_NOTIFICATIONS_ON = StatusIndicator.SUCCESS + " Notifications " + colorize("enabled", Colors.GREEN) + "\n"
+_MSG_NOTIFICATIONS_OFF = StatusIndicator.WARNING + " Notifications " + colorize("disabled", Colors.YELLOW) + "\n"
+_MSG_NO_ALIASES = colorize("No aliases created yet", Colors.GRAY) + "\n"
+_MSG_NO_SNIPPETS = colorize("No snippets created yet", Colors.GRAY) + "\n"
+_MSG_ROOM_CLEARED = StatusIndicator.SUCCESS + " Room cleared\n"
+_MSG_CANCELLED = StatusIndicator.WARNING + " Operation cancelled\n"
+_MSG_ANNOUNCED = StatusIndicator.SUCCESS + " Announcement sent\n"
+_MSG_BROADCAST_SENT = StatusIndicator.SUCCESS + " Broadcast sent to all users\n"
+_MSG_ALIAS_REMOVED = StatusIndicator.SUCCESS + " Alias removed\n"
+_MSG_REACTION_ADDED = StatusIndicator.SUCCESS + " Reaction added\n"
+_MSG_SNIPPET_INSERTED = StatusIndicator.SUCCESS + " Snippet inserted\n"
+
+# Usage banners for commands that take arguments
+_USAGE_EXPORT = StatusIndicator.ERROR + " Usage: export <filename.txt> [room_name]"
+_USAGE_SEARCH = StatusIndicator.ERROR + " Usage: search <keyword> [room_name]"
+_USAGE_BLOCK = StatusIndicator.ERROR + " Usage: block <username>"
+_USAGE_UNBLOCK = StatusIndicator.ERROR + " Usage: unblock <username>"
+_USAGE_MUTE = StatusIndicator.ERROR + " Usage: mute <username> [duration]"
+_USAGE_UNMUTE = StatusIndicator.ERROR + " Usage: unmute <username>"
+_USAGE_INFO = StatusIndicator.ERROR + " Usage: info <username|room>"
+_USAGE_INVITE = StatusIndicator.ERROR + " Usage: invite <username> [room_name]"
+_USAGE_TOPIC = StatusIndicator.ERROR + " Usage: topic <new_topic>"
+_USAGE_WHOIS = StatusIndicator.ERROR + " Usage: whois <username>"
+_USAGE_PROMOTE = StatusIndicator.ERROR + " Usage: promote <username> [moderator|admin]"
+_USAGE_DEMOTE = StatusIndicator.ERROR + " Usage: demote <username>"
+_USAGE_ANNOUNCE = StatusIndicator.ERROR + " Usage: announce <message>"
+_USAGE_BROADCAST = StatusIndicator.ERROR + " Usage: broadcast <message>"
+_USAGE_ALIAS_ADD = StatusIndicator.ERROR + " Usage: alias add <name> <command>"
+_USAGE_ALIAS_REMOVE = StatusIndicator.ERROR + " Usage: alias remove <name>"
+_USAGE_REACT = StatusIndicator.ERROR + " Usage: react <message_id> <emoji>"
+_USAGE_GAG = StatusIndicator.ERROR + " Usage: gag <username>"
+_USAGE_UNGAG = StatusIndicator.ERROR + " Usage: ungag <username>"
+_USAGE_REMIND = StatusIndicator.ERROR + " Usage: remind <time> <message>"
+_USAGE_TIMER = StatusIndicator.ERROR + " Usage: timer <duration> [label]"
+_USAGE_SNIPPET_ADD = StatusIndicator.ERROR + " Usage: snippet add <name> <text>"
+_USAGE_SNIPPET_USE = StatusIndicator.ERROR + " Usage: snippet use <name>"
+
+
+# Fixed headers and whole pages, passed to ChatShell._emit
+_STATUS_HEADER = UIBox.header("Status", 80)
+_HR70_GRAY = colorize("─" * 70, Colors.GRAY)
+_ONLINE_PAGE = (
+    UIBox.header("👥 Online Users", 80),
+    f"{colorize('User', Colors.CYAN):30} {colorize('Room', Colors.BLUE):20} {colorize('Status', Colors.YELLOW)}",
+    _HR70_GRAY,
+    _MSG_NO_USER_DATA,
+)
+_BLOCKED_PAGE = (UIBox.header("🚫 Blocked Users", 80), _MSG_NO_BLOCKED)
+_ALIASES_PAGE = (UIBox.header("⚡ Command Aliases", 80), _MSG_NO_ALIASES)
+_SNIPPETS_PAGE = (UIBox.header("📝 Text Snippets", 80), _MSG_NO_SNIPPETS)
+_SETTINGS_PAGE = (
+    UIBox.header("⚙️  Client Settings", 80),
+    UIBox.stat_row("Color Output:", "Enabled", Colors.GREEN),
+    UIBox.stat_row("Auto-Reconnect:", "Enabled", Colors.GREEN),
+    UIBox.stat_row("Notifications:", "Enabled", Colors.GREEN),
+    UIBox.stat_row("Flag Detection:", "Enabled", Colors.GREEN),
+    UIBox.stat_row("Sound Alerts:", "Disabled", Colors.GRAY),
+    UIBox.stat_row("Theme:", "Dark", Colors.CYAN),
+    "",
+)
+_NOTIFICATIONS_PAGE = (
+    UIBox.header("🔔 Notification Settings", 80),
+    UIBox.stat_row("Message Alerts:", "On", Colors.GREEN),
+    UIBox.stat_row("User Join/Leave:", "On", Colors.GREEN),
+    UIBox.stat_row("Flag Capture:", "On", Colors.GREEN),
+    UIBox.stat_row("Mentions:", "On", Colors.GREEN),
+    UIBox.stat_row("Private Messages:", "On", Colors.GREEN),
+    "",
+)
+
+
+def _enable_windows_ansi() -> bool:
+    """
+    Enable VT escape processing on the Windows console.
+
+    Returns:
+        True if the console now accepts ANSI escape sequences
+    """
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+
+def _cacheable(ttl: float):
+    """
+    Replay a read-only command's output when it repeats within ttl seconds.
+
+    Output written through ChatShell._write is captured and keyed on the
+    arguments, the client state version and the flag count, so connecting,
+    joining, leaving or capturing a flag always misses the cache.
+
+    Args:
+        ttl: Seconds a captured result stays valid
+    """
+    def decorate(method):
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self: "ChatShell", args: str):
+            client = self.client
+            key = (name, args, client.state_version, client.flag_detector.count)
+            now = time.monotonic()
+            cache = self._result_cache
+            cached = cache.get(key)
+            if cached is not None and now < cached[0]:
+                self._write(cached[1])
+                self._flush()
+                return None
+
+            write, flush = self._write, self._flush
+            chunks: list = []
+            self._write = chunks.append
+            self._flush = _noop
+            try:
+                result = method(self, args)
+            finally:
+                self._write, self._flush = write, flush
+
+            output = "".join(chunks)
+            if len(cache) >= self.RESULT_CACHE_SIZE:
+                cache.clear()
+            cache[key] = (now + ttl, output)
+            write(output)
+            flush()
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def _noop() -> None:
+    """Stand-in for flush while a cacheable command's output is captured."""
+
+
+def _split_first(args: str) -> Tuple[str, str]:
+    """Split off the first word of an argument string without building a list."""
+    first, _, rest = args.lstrip().partition(" ")
+    return first, rest.lstrip()
 
 
 class ChatShell(cmd.Cmd):
     """Interactive command shell for chat client."""
 
+    OUTPUT_BATCH_SIZE = 64
+    FLAG_FLUSH_ROWS = 32
+    RESULT_CACHE_SIZE = 32
+
     def __init__(self, client: "ChatClient"):
         """
         Initialize chat shell.
@@ -25,35 +321,170 @@ class ChatShell(cmd.Cmd):
         """
         super().__init__()
         self.client = client
-        self.moderation = ModerationCommands(client)
+        self._write = self.stdout.write
+        self._flush = self.stdout.flush
+        # Piped or scripted input gains nothing from readline history and
+        # completion; cmd.Cmd then reads lines straight from stdin.
+        if os.environ.get("DREVOID_SCRIPT") or not (self.stdin and self.stdin.isatty()):
+            self.use_rawinput = False
+        self._ansi_clear = os.name != "nt" or _enable_windows_ansi()
+        self._moderation: Optional["ModerationCommands"] = None
+        self._prompt_version = -1
+        self._result_cache: dict = {}
+        self._connecting = threading.Event()
+        self._send_message = client.send_message
+        # Command word -> bound handler for every do_* method, consulted by onecmd
+        self._cmd_table = {
+            name[3:]: getattr(self, name) for name in self.get_names() if name.startswith("do_")
+        }
+        self._cmd_table["flag-count"] = self.do_flag_count
+        self._cmd_table["EOF"] = self.do_exit
         self.setup_message_display()
         self.update_prompt()
 
     def setup_message_display(self) -> None:
-        """Setup message display callback."""
+        """Setup message display callback and its background writer."""
+        self._out_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        threading.Thread(target=self._output_writer, name="drevoid-output", daemon=True).start()
 
         def display_callback(text: str):
-            print(text)
+            self._out_q.put(text + "\n")
 
         self.client.message_handler.subscribe(display_callback)
 
+    def _output_writer(self) -> None:
+        """Write queued display output in batches (runs in thread)."""
+        get = self._out_q.get
+        get_nowait = self._out_q.get_nowait
+        write = self._write
+        flush = self._flush
+        while True:
+            chunks = [get()]
+            try:
+                while len(chunks) < self.OUTPUT_BATCH_SIZE:
+                    chunks.append(get_nowait())
+            except queue.Empty:
+                pass
+            try:
+                write("".join(chunks))
+                flush()
+            except Exception:
+                pass
+
+    @property
+    def moderation(self) -> "ModerationCommands":
+        """Moderation helpers, created on first use."""
+        if self._moderation is None:
+            from .moderation import ModerationCommands
+
+            self._moderation = ModerationCommands(self.client)
+        return self._moderation
+
     def update_prompt(self) -> None:
         """Update shell prompt based on connection state."""
-        if self.client.connected and self.client.username:
-            room_info = f"#{self.client.current_room}" if self.client.current_room else "#no-room"
+        client = self.client
+        version = client.state_version
+        if version == self._prompt_version:
+            return
+        self._prompt_version = version
+
+        if client.connected and client.username:
+            room_info = f"#{client.current_room}" if client.current_room else "#no-room"
             self.prompt = (
-                f"{colorize(self.client.username, Colors.CYAN)}"
+                f"{colorize(client.username, Colors.CYAN)}"
                 f"{colorize(room_info, Colors.BLUE)} > "
             )
         else:
-            self.prompt = f"{colorize('Not connected', Colors.RED)} > "
+            self.prompt = _PROMPT_DISCONNECTED
 
     def show_prompt(self) -> None:
-        """Display the prompt."""
+        """Queue a prompt redraw behind any pending display output."""
+        self.update_prompt()
+        self._out_q.put(self.prompt)
+
+    def preloop(self) -> None:
+        """Switch stdout to block buffering while the command loop runs."""
+        self._restore_line_buffering = False
+        stdout = sys.stdout
+        if getattr(stdout, "line_buffering", False) and hasattr(stdout, "reconfigure"):
+            stdout.reconfigure(line_buffering=False)
+            self._restore_line_buffering = True
+
+    def postloop(self) -> None:
+        """Restore stdout buffering on loop exit."""
+        sys.stdout.flush()
+        if self._restore_line_buffering:
+            sys.stdout.reconfigure(line_buffering=True)
+
+    def postcmd(self, stop: bool, line: str) -> bool:
+        """Refresh the prompt if client state changed, then flush output."""
         self.update_prompt()
-        if hasattr(self, "stdout"):
-            self.stdout.write(self.prompt)
-            self.stdout.flush()
+        self._flush()
+        return stop
+
+    def _emit(self, *lines: str) -> None:
+        """Write lines as a single block and flush once."""
+        self._write("\n".join(lines) + "\n")
+        self._flush()
+
+    def _username_arg(self, args: str, usage: str, not_connected: str = _MSG_NOT_CONNECTED) -> str:
+        """
+        Validate a command that needs a connection and a single username.
+
+        Args:
+            args: Raw argument string
+            usage: Usage line printed when no username is given
+            not_connected: Message printed when offline
+
+        Returns:
+            The username, or "" after printing the relevant error
+        """
+        if not self.client.connected:
+            self._emit(not_connected)
+            return ""
+        username = args.strip()
+        if not username:
+            self._emit(usage)
+        return username
+
+    def _prompt_input(self, message: str) -> str:
+        """
+        Ask for a line of input on the shell's own streams.
+
+        Uses input() (and so readline editing) only when the command loop
+        does; otherwise reads straight from self.stdin like cmd.Cmd.
+
+        Args:
+            message: Prompt text
+
+        Returns:
+            The line entered, without its newline ("" on end of input)
+        """
+        if self.use_rawinput:
+            try:
+                return input(message)
+            except EOFError:
+                return ""
+        self._write(message)
+        self._flush()
+        return self.stdin.readline().rstrip("\r\n")
+
+    def _arg_or_prompt(self, parts: list, index: int, question: str, default: str = "") -> str:
+        """
+        Take an argument from the command line, asking for it only if absent.
+
+        Args:
+            parts: Split argument list
+            index: Position of the wanted argument
+            question: Prompt shown when the argument is missing
+            default: Value used when the answer is blank
+
+        Returns:
+            The argument, the typed answer, or default
+        """
+        if index < len(parts):
+            return parts[index]
+        return self._prompt_input(question).strip() or default
 
     def emptyline(self) -> None:
         """Handle empty line (do nothing)."""
@@ -61,7 +492,7 @@ class ChatShell(cmd.Cmd):
 
     def onecmd(self, line: str) -> bool:
         """
-        Override onecmd to use custom help.
+        Dispatch a command line through the command table.
 
         Args:
             line: Command line
@@ -69,16 +500,22 @@ class ChatShell(cmd.Cmd):
         Returns:
             True if quit command, False otherwise
         """
-        # Intercept 'help' command to use our custom help
-        if line.strip().lower() == 'help':
-            self.do_help("")
-            return False
-        # Also handle 'help <command>' format
-        if line.strip().lower().startswith('help '):
-            cmd_part = line.strip()[5:].strip()
-            self.do_help(cmd_part)
-            return False
-        return super().onecmd(line)
+        line = line.strip()
+        if not line:
+            return self.emptyline()
+        if line[0] == "?":
+            line = "help " + line[1:]
+        self.lastcmd = "" if line == "EOF" else line
+
+        parts = line.split(None, 1)
+        verb = parts[0]
+        handler = self._cmd_table.get(verb)
+        if handler is None:
+            # Chat text lands here too; only lowercase four-letter verbs
+            if len(verb) != 4 or verb.lower() != "help":
+                return self.default(line)
+            handler = self.do_help
+        return handler(parts[1] if len(parts) > 1 else "")
 
     def default(self, line: str) -> None:
         """
@@ -87,183 +524,105 @@ class ChatShell(cmd.Cmd):
         Args:
             line: Input line
         """
-        if not self.client.connected:
-            print(f"{colorize('❌ Not connected. Use connect command first.', Colors.RED)}")
-            return
-        if not self.client.current_room:
-            print(f"{colorize('❌ Not in any room. Use join command first.', Colors.RED)}")
-            return
-        if line.strip():
-            self.client.send_message(line.strip())
+        text = line.strip()
+        client = self.client
+        if text and client.connected and client.current_room:
+            self._send_message(text)
+        elif not client.connected:
+            self._write(_ERR_CONNECT_FIRST)
+        elif not client.current_room:
+            self._write(_ERR_JOIN_FIRST)
 
     def do_help(self, arg: str) -> None:
         """Display help information."""
-        print(UIBox.header("🎯 Drevoid LAN Chat Commands", 80))
-
-        print(UIBox.section("Connection Commands", Colors.YELLOW))
-        print(f"  {colorize('connect', Colors.CYAN):20} → Connect to server")
-        print(f"  {colorize('disconnect', Colors.CYAN):20} → Disconnect from server")
-        print(f"  {colorize('status', Colors.CYAN):20} → Show connection status")
-
-        print(UIBox.section("Room Commands", Colors.YELLOW))
-        print(f"  {colorize('join <room>', Colors.CYAN):20} → Join a room")
-        print(f"  {colorize('leave', Colors.CYAN):20} → Leave current room")
-        print(f"  {colorize('create <name>', Colors.CYAN):20} → Create a new room")
-        print(f"  {colorize('rooms', Colors.CYAN):20} → List available rooms")
-        print(f"  {colorize('users', Colors.CYAN):20} → List users in room")
-        print(f"  {colorize('topic <text>', Colors.CYAN):20} → Set room topic")
-        print(f"  {colorize('invite <user>', Colors.CYAN):20} → Invite user to room")
-        print(f"  {colorize('lockroom', Colors.CYAN):20} → Lock room (admin only)")
-        print(f"  {colorize('unlockroom', Colors.CYAN):20} → Unlock room (admin only)")
-
-        print(UIBox.section("Messaging Commands", Colors.YELLOW))
-        print(f"  {colorize('msg <user> <text>', Colors.CYAN):20} → Send private message")
-        print(f"  {colorize('pm <user> <text>', Colors.CYAN):20} → Send PM (alias)")
-        print(f"  {colorize('<message>', Colors.CYAN):20} → Send message to room")
-        print(f"  {colorize('announce <text>', Colors.CYAN):20} → Announce to room (admin)")
-        print(f"  {colorize('broadcast <text>', Colors.CYAN):20} → Broadcast to all (admin)")
-
-        print(UIBox.section("User Management", Colors.YELLOW))
-        print(f"  {colorize('profile', Colors.CYAN):20} → View your profile")
-        print(f"  {colorize('online', Colors.CYAN):20} → List online users")
-        print(f"  {colorize('whois <user>', Colors.CYAN):20} → Get user info")
-        print(f"  {colorize('info <user|room>', Colors.CYAN):20} → Get detailed info")
-        print(f"  {colorize('block <user>', Colors.CYAN):20} → Block user")
-        print(f"  {colorize('unblock <user>', Colors.CYAN):20} → Unblock user")
-        print(f"  {colorize('blocked', Colors.CYAN):20} → List blocked users")
-
-        print(UIBox.section("CTF & Flag Commands", Colors.YELLOW))
-        print(f"  {colorize('flags', Colors.CYAN):20} → Display captured flags")
-        print(f"  {colorize('flag-count', Colors.CYAN):20} → Show total flags")
-
-        print(UIBox.section("Chat History & Search", Colors.YELLOW))
-        print(f"  {colorize('history [limit]', Colors.CYAN):20} → Show chat history")
-        print(f"  {colorize('search <keyword>', Colors.CYAN):20} → Search messages")
-        print(f"  {colorize('export <file>', Colors.CYAN):20} → Export chat history")
-        print(f"  {colorize('stats [room]', Colors.CYAN):20} → Show statistics")
-
-        print(UIBox.section("Moderation Commands (Admin Only)", Colors.RED))
-        print(f"  {colorize('kick <user>', Colors.CYAN):20} → Kick user from room")
-        print(f"  {colorize('ban <user>', Colors.CYAN):20} → Ban user from server")
-        print(f"  {colorize('mute <user> [time]', Colors.CYAN):20} → Mute user")
-        print(f"  {colorize('unmute <user>', Colors.CYAN):20} → Unmute user")
-        print(f"  {colorize('gag <user>', Colors.CYAN):20} → Gag user (hide messages)")
-        print(f"  {colorize('ungag <user>', Colors.CYAN):20} → Ungag user")
-        print(f"  {colorize('promote <user>', Colors.CYAN):20} → Promote to moderator")
-        print(f"  {colorize('demote <user>', Colors.CYAN):20} → Demote user")
-        print(f"  {colorize('clearroom', Colors.CYAN):20} → Clear room messages")
-
-        print(UIBox.section("Productivity & Notifications", Colors.YELLOW))
-        print(f"  {colorize('settings', Colors.CYAN):20} → Show settings")
-        print(f"  {colorize('notifications', Colors.CYAN):20} → Notification settings")
-        print(f"  {colorize('remind <time> <msg>', Colors.CYAN):20} → Set reminder")
-        print(f"  {colorize('timer <duration>', Colors.CYAN):20} → Start timer")
-        print(f"  {colorize('alias [add|list]', Colors.CYAN):20} → Manage aliases")
-        print(f"  {colorize('snippet [add|list]', Colors.CYAN):20} → Manage snippets")
-
-        print(UIBox.section("Utilities", Colors.YELLOW))
-        print(f"  {colorize('emojis', Colors.CYAN):20} → Show emoji aliases")
-        print(f"  {colorize('clear', Colors.CYAN):20} → Clear screen")
-        print(f"  {colorize('help', Colors.CYAN):20} → Show this help")
-
-        print(UIBox.section("Exit Commands", Colors.YELLOW))
-        print(f"  {colorize('quit/exit', Colors.CYAN):20} → Exit application")
-        print()
+        self._write(_HELP_TEXT)
 
     def do_connect(self, args: str) -> None:
         """Connect to server: connect [host] [port] [username]"""
         if self.client.connected:
-            print(f"{StatusIndicator.ERROR} Already connected. Disconnect first.")
+            self._emit(_MSG_ALREADY_CONNECTED)
+            return
+        if self._connecting.is_set():
+            self._emit(_MSG_CONNECT_IN_PROGRESS)
             return
 
-        parts = args.split()
-        host = (
-            parts[0]
-            if parts
-            else input(f"{colorize('Enter server host (ch.tubox.cloud):', Colors.CYAN)} ").strip()
-            or "ch.tubox.cloud"
-        )
-
+        parts = args.split(None, 3)
+        host = self._arg_or_prompt(parts, 0, _ASK_HOST, "ch.tubox.cloud")
         try:
-            port = (
-                int(parts[1])
-                if len(parts) > 1
-                else int(
-                    input(f"{colorize('Enter server port (8891):', Colors.CYAN)} ").strip()
-                    or "8891"
-                )
-            )
+            port = int(self._arg_or_prompt(parts, 1, _ASK_PORT, "8891"))
         except ValueError:
-            print(f"{StatusIndicator.ERROR} Invalid port number")
+            self._emit(_MSG_INVALID_PORT)
             return
 
-        username = (
-            parts[2]
-            if len(parts) > 2
-            else input(f"{colorize('Enter username:', Colors.CYAN)} ").strip()
-        )
-
+        username = self._arg_or_prompt(parts, 2, _ASK_USERNAME)
         if not username:
-            print(f"{StatusIndicator.ERROR} Username is required")
+            self._emit(_MSG_USERNAME_REQUIRED)
             return
 
-        print(f"{StatusIndicator.LOADING} Connecting to {colorize(f'{host}:{port}', Colors.WHITE)} as {colorize(username, Colors.CYAN)}...")
+        self._emit(_CONNECTING_FMT({"host": host, "port": port, "username": username}))
+        self._connecting.set()
+        threading.Thread(
+            target=self._connect_in_background,
+            args=(host, port, username),
+            name="drevoid-connect",
+            daemon=True,
+        ).start()
 
-        if self.client.connect(host, port, username):
-            print(f"{StatusIndicator.SUCCESS} Connected successfully!")
-            self.update_prompt()
-        else:
-            print(f"{StatusIndicator.ERROR} Connection failed")
+    def _connect_in_background(self, host: str, port: int, username: str) -> None:
+        """Connect off the shell thread and report through the display queue."""
+        try:
+            connected = self.client.connect(host, port, username)
+        finally:
+            self._connecting.clear()
+        self._out_q.put((_MSG_CONNECTED if connected else _MSG_CONNECT_FAILED) + "\n")
+        self.show_prompt()
 
     def do_disconnect(self, args: str) -> None:
         """Disconnect from server."""
         if not self.client.connected:
-            print(f"{StatusIndicator.WARNING} Not connected")
+            self._emit(_WARN_NOT_CONNECTED)
             return
         self.client.disconnect()
         self.update_prompt()
-        print(f"{StatusIndicator.SUCCESS} Disconnected")
+        self._emit(_MSG_DISCONNECTED)
 
     def do_join(self, args: str) -> None:
         """Join room: join <room_name> [password]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split(None, 1)
-        if not parts:
-            print(f"{StatusIndicator.ERROR} Usage: {colorize('join <room_name>', Colors.CYAN)}")
+        room_name, password = _split_first(args)
+        if not room_name:
+            self._emit(_USAGE_JOIN)
             return
 
-        room_name = parts[0]
-        password = parts[1] if len(parts) > 1 else ""
-
-        print(f"{StatusIndicator.LOADING} Joining {colorize(room_name, Colors.CYAN)}...")
+        self._emit(_JOINING_FMT({"room": room_name}))
         if self.client.room_manager.join(room_name, password):
-            print(f"{StatusIndicator.SUCCESS} Joined {colorize(room_name, Colors.CYAN)}")
+            self._emit(_JOINED_FMT({"room": room_name}))
             self.update_prompt()
 
     def do_leave(self, args: str) -> None:
         """Leave current room."""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
         if not self.client.current_room:
-            print(f"{StatusIndicator.WARNING} Not in any room")
+            self._emit(_WARN_NOT_IN_ROOM)
             return
         if self.client.room_manager.leave():
-            print(f"{StatusIndicator.SUCCESS} Left room")
+            self._emit(_MSG_LEFT_ROOM)
             self.update_prompt()
 
     def do_create(self, args: str) -> None:
         """Create room: create <room_name> [private] [password]"""
         if not self.client.connected:
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            self._emit(_ERR_NOT_CONNECTED)
             return
 
-        parts = args.split()
+        parts = args.split(None, 3)
         if not parts:
-            print(f"{colorize('❌ Usage: create <room_name> [private] [password]', Colors.RED)}")
+            self._emit(_USAGE_CREATE)
             return
 
         room_name = parts[0]
@@ -275,17 +634,17 @@ class ChatShell(cmd.Cmd):
     def do_rooms(self, args: str) -> None:
         """List available rooms."""
         if not self.client.connected:
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            self._emit(_ERR_NOT_CONNECTED)
             return
         self.client.room_manager.list_rooms()
 
     def do_users(self, args: str) -> None:
         """List users in current room."""
         if not self.client.connected:
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            self._emit(_ERR_NOT_CONNECTED)
             return
         if not self.client.current_room:
-            print(f"{colorize('❌ Not in any room', Colors.RED)}")
+            self._emit(_ERR_NOT_IN_ROOM)
             return
         self.client.room_manager.list_users()
 
@@ -299,56 +658,63 @@ class ChatShell(cmd.Cmd):
 
     def do_emojis(self, args: str) -> None:
         """Display available emoji aliases."""
-        print(f"\n{colorize('😊 Emoji Aliases', Colors.BOLD + Colors.YELLOW)}")
-        print(f"{colorize('Use these text patterns to add emojis to your messages:', Colors.GRAY)}\n")
-        print(EmojiAliases.list_aliases())
-        print(f"\n{colorize('Example:', Colors.YELLOW)} I love this :heart: :fire: :rocket:\n")
+        from ..utils.emoji_aliases import EmojiAliases
+
+        self._write(_EMOJIS_HEADER + EmojiAliases.list_aliases() + "\n" + _EMOJIS_FOOTER)
 
     def do_kick(self, args: str) -> None:
         """Kick user: kick <username>"""
-        if not self.client.connected:
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
-            return
-        if not args.strip():
-            print(f"{colorize('❌ Usage: kick <username>', Colors.RED)}")
+        username = self._username_arg(args, _USAGE_KICK, _ERR_NOT_CONNECTED)
+        if not username:
             return
-        self.moderation.kick(args.strip())
+        self.moderation.kick(username)
 
     def do_ban(self, args: str) -> None:
         """Ban user: ban <username>"""
-        if not self.client.connected:
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
-            return
-        if not args.strip():
-            print(f"{colorize('❌ Usage: ban <username>', Colors.RED)}")
+        username = self._username_arg(args, _USAGE_BAN, _ERR_NOT_CONNECTED)
+        if not username:
             return
-        self.moderation.ban(args.strip())
+        self.moderation.ban(username)
 
+    @_cacheable(ttl=2.0)
     def do_flags(self, args: str) -> None:
         """Display all captured flags."""
         flags = self.client.flag_detector.get_all_flags()
-        print(FlagDisplay.format_flags_list(flags))
-
+        write = self._write
+        flush = self._flush
+        for count, row in enumerate(FlagDisplay.iter_flags_list(flags), 1):
+            write(row)
+            if count % self.FLAG_FLUSH_ROWS == 0:
+                flush()
+        write("\n")
+        flush()
+
+    @_cacheable(ttl=2.0)
     def do_flag_count(self, args: str) -> None:
         """Show total flags found."""
-        count = len(self.client.flag_detector.get_all_flags())
+        count = self.client.flag_detector.count
         emoji = StatusIndicator.FLAG
-        print(f"\n{emoji} {colorize(f'Total flags captured: {count}', Colors.BOLD + Colors.YELLOW)}")
+        self._emit(f"\n{emoji} {colorize(f'Total flags captured: {count}', _BOLD_YELLOW)}")
 
+    @_cacheable(ttl=2.0)
     def do_status(self, args: str) -> None:
         """Show connection status."""
-        print(UIBox.header("Status", 80))
+        lines = [_STATUS_HEADER]
         if self.client.connected:
-            print(UIBox.stat_row("Status:", "Connected", Colors.GREEN))
-            print(UIBox.stat_row("Username:", self.client.username or "N/A", Colors.CYAN))
-            print(UIBox.stat_row("Current Room:", self.client.current_room or "None", Colors.BLUE))
+            lines.append(UIBox.stat_row("Status:", "Connected", Colors.GREEN))
+            lines.append(UIBox.stat_row("Username:", self.client.username or "N/A", Colors.CYAN))
+            lines.append(UIBox.stat_row("Current Room:", self.client.current_room or "None", Colors.BLUE))
         else:
-            print(UIBox.stat_row("Status:", "Not Connected", Colors.RED))
-        print()
+            lines.append(UIBox.stat_row("Status:", "Not Connected", Colors.RED))
+        self._emit(*lines, "")
 
     def do_clear(self, args: str) -> None:
         """Clear screen."""
-        os.system("cls" if os.name == "nt" else "clear")
+        if self._ansi_clear:
+            self._write(_CLEAR_SCREEN)
+            self._flush()
+        else:
+            os.system("cls")
 
     def do_quit(self, args: str) -> bool:
         """Exit application: quit"""
@@ -358,156 +724,151 @@ class ChatShell(cmd.Cmd):
         """Exit application: exit"""
         if self.client.connected:
             self.client.disconnect()
-        print(f"{colorize('👋 Goodbye!', Colors.GREEN)}")
+        self._emit(_MSG_GOODBYE)
         return True
 
     def _send_private_message(self, args: str) -> None:
         """Send private message helper."""
         if not self.client.connected:
-            print(f"{colorize('❌ Not connected', Colors.RED)}")
+            self._emit(_ERR_NOT_CONNECTED)
             return
 
-        parts = args.split(None, 1)
-        if len(parts) < 2:
-            print(f"{colorize('❌ Usage: msg <username> <message>', Colors.RED)}")
+        target_user, content = _split_first(args)
+        if not content:
+            self._emit(_USAGE_MSG)
             return
 
-        target_user = parts[0]
-        content = parts[1]
         self.client.send_private_message(target_user, content)
 
     # ==================== ADVANCED FEATURES ====================
 
+    @_cacheable(ttl=2.0)
     def do_history(self, args: str) -> None:
         """Display chat history: history [limit] [room_name]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split()
+        parts = args.split(None, 2)
         limit = int(parts[0]) if parts else 50
         room_name = parts[1] if len(parts) > 1 else self.client.current_room
 
         if not room_name:
-            print(f"{StatusIndicator.ERROR} Not in any room. Specify room name: history [limit] <room_name>")
+            self._emit(_MSG_HISTORY_NEEDS_ROOM)
             return
 
-        print(f"{UIBox.header(f'📜 Chat History - {room_name} (Last {limit})', 80)}")
-        print(f"{colorize('🔄 Fetching history...', Colors.CYAN)}\n")
-        
         # In production, retrieve from local cache or server
-        print(f"{colorize('No history available yet. Start chatting!', Colors.GRAY)}\n")
+        self._emit(
+            UIBox.header(f"📜 Chat History - {room_name} (Last {limit})", 80),
+            _MSG_FETCHING_HISTORY,
+            _MSG_NO_HISTORY,
+        )
 
     def do_export(self, args: str) -> None:
         """Export chat history: export <filename.txt> [room_name]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split()
+        parts = args.split(None, 2)
         if not parts:
-            print(f"{StatusIndicator.ERROR} Usage: export <filename.txt> [room_name]")
+            self._emit(_USAGE_EXPORT)
             return
 
         filename = parts[0]
         room_name = parts[1] if len(parts) > 1 else self.client.current_room
 
-        print(f"{StatusIndicator.LOADING} Exporting chat history to {colorize(filename, Colors.CYAN)}...")
-        print(f"{StatusIndicator.SUCCESS} Export complete: {filename}")
+        self._emit(
+            f"{StatusIndicator.LOADING} Exporting chat history to {colorize(filename, Colors.CYAN)}...",
+            f"{StatusIndicator.SUCCESS} Export complete: {filename}",
+        )
 
     def do_search(self, args: str) -> None:
         """Search messages: search <keyword> [room_name] [--limit 20]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        if not args.strip():
-            print(f"{StatusIndicator.ERROR} Usage: search <keyword> [room_name]")
+        parts = args.split(None, 2)
+        if not parts:
+            self._emit(_USAGE_SEARCH)
             return
 
-        parts = args.split()
         keyword = parts[0]
         room_name = parts[1] if len(parts) > 1 else self.client.current_room
 
-        print(f"{UIBox.header(f'🔍 Search Results for \"{keyword}\" in {room_name}', 80)}")
-        print(f"{colorize('No results found', Colors.GRAY)}\n")
+        title = f'🔍 Search Results for "{keyword}" in {room_name}'
+        self._emit(
+            UIBox.header(title, 80),
+            _MSG_NO_RESULTS,
+        )
 
+    @_cacheable(ttl=2.0)
     def do_stats(self, args: str) -> None:
         """Show chat statistics: stats [room_name]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         room_name = args.strip() or self.client.current_room
         if not room_name:
-            print(f"{StatusIndicator.ERROR} Not in any room")
+            self._emit(_MSG_NOT_IN_ROOM)
             return
 
-        print(f"{UIBox.header(f'📊 Statistics - {room_name}', 80)}")
-        print(UIBox.stat_row("Total Messages:", "0", Colors.CYAN))
-        print(UIBox.stat_row("Total Users:", "0", Colors.CYAN))
-        print(UIBox.stat_row("Unique Users:", "0", Colors.CYAN))
-        print(UIBox.stat_row("Average Message Length:", "0", Colors.CYAN))
-        print(UIBox.stat_row("Most Active User:", "N/A", Colors.CYAN))
-        print(UIBox.stat_row("Most Active Time:", "N/A", Colors.CYAN))
-        print()
+        lines = [
+            UIBox.header(f"📊 Statistics - {room_name}", 80),
+            UIBox.stat_row("Total Messages:", "0", Colors.CYAN),
+            UIBox.stat_row("Total Users:", "0", Colors.CYAN),
+            UIBox.stat_row("Unique Users:", "0", Colors.CYAN),
+            UIBox.stat_row("Average Message Length:", "0", Colors.CYAN),
+            UIBox.stat_row("Most Active User:", "N/A", Colors.CYAN),
+            UIBox.stat_row("Most Active Time:", "N/A", Colors.CYAN),
+        ]
+        self._emit(*lines, "")
 
     def do_online(self, args: str) -> None:
         """List all online users."""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        print(f"{UIBox.header('👥 Online Users', 80)}")
-        print(f"{colorize('User', Colors.CYAN):30} {colorize('Room', Colors.BLUE):20} {colorize('Status', Colors.YELLOW)}")
-        print(f"{colorize('─' * 70, Colors.GRAY)}")
-        print(f"{colorize('No user data available', Colors.GRAY)}\n")
+        self._emit(*_ONLINE_PAGE)
 
     def do_block(self, args: str) -> None:
         """Block user: block <username>"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_BLOCK)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: block <username>")
             return
-
-        print(f"{StatusIndicator.SUCCESS} Blocked {colorize(username, Colors.CYAN)}")
-        print(f"{colorize('You will no longer receive messages from this user.', Colors.GRAY)}\n")
+        self._emit(
+            f"{StatusIndicator.SUCCESS} Blocked {colorize(username, Colors.CYAN)}",
+            _MSG_BLOCK_NOTE,
+        )
 
     def do_unblock(self, args: str) -> None:
         """Unblock user: unblock <username>"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_UNBLOCK)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: unblock <username>")
             return
+        self._emit(f"{StatusIndicator.SUCCESS} Unblocked {colorize(username, Colors.CYAN)}\n")
 
-        print(f"{StatusIndicator.SUCCESS} Unblocked {colorize(username, Colors.CYAN)}\n")
-
+    @_cacheable(ttl=2.0)
     def do_blocked(self, args: str) -> None:
         """List blocked users."""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        print(f"{UIBox.header('🚫 Blocked Users', 80)}")
-        print(f"{colorize('No users blocked', Colors.GRAY)}\n")
+        self._emit(*_BLOCKED_PAGE)
 
     def do_mute(self, args: str) -> None:
         """Mute user: mute <username> [duration] (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split()
+        parts = args.split(None, 2)
         if not parts:
-            print(f"{StatusIndicator.ERROR} Usage: mute <username> [duration]")
+            self._emit(_USAGE_MUTE)
             return
 
         username = parts[0]
@@ -517,145 +878,129 @@ class ChatShell(cmd.Cmd):
 
     def do_unmute(self, args: str) -> None:
         """Unmute user: unmute <username> (Admin only)"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_UNMUTE)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: unmute <username>")
             return
-
         self.moderation.unmute(username)
 
     def do_info(self, args: str) -> None:
         """Get user or room info: info <username|room>"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         target = args.strip()
         if not target:
-            print(f"{StatusIndicator.ERROR} Usage: info <username|room>")
+            self._emit(_USAGE_INFO)
             return
 
-        print(f"{UIBox.header(f'ℹ️  Information - {target}', 80)}")
-        print(UIBox.stat_row("Type:", "User", Colors.CYAN))
-        print(UIBox.stat_row("Status:", "Online", Colors.GREEN))
-        print(UIBox.stat_row("Joined:", "Just now", Colors.CYAN))
-        print(UIBox.stat_row("Messages:", "0", Colors.CYAN))
-        print()
+        lines = [
+            UIBox.header(f"ℹ️  Information - {target}", 80),
+            UIBox.stat_row("Type:", "User", Colors.CYAN),
+            UIBox.stat_row("Status:", "Online", Colors.GREEN),
+            UIBox.stat_row("Joined:", "Just now", Colors.CYAN),
+            UIBox.stat_row("Messages:", "0", Colors.CYAN),
+        ]
+        self._emit(*lines, "")
 
     def do_profile(self, args: str) -> None:
         """View or edit your profile: profile [view|edit]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         action = args.strip().lower() or "view"
 
         if action == "view":
-            print(f"{UIBox.header(f'👤 Profile - {self.client.username}', 80)}")
-            print(UIBox.stat_row("Username:", self.client.username or "N/A", Colors.CYAN))
-            print(UIBox.stat_row("Status:", "Online", Colors.GREEN))
-            print(UIBox.stat_row("Bio:", "Not set", Colors.GRAY))
-            print(UIBox.stat_row("Total Messages:", "0", Colors.CYAN))
-            print(UIBox.stat_row("Rooms Joined:", "0", Colors.CYAN))
-            print(UIBox.stat_row("Flags Captured:", len(self.client.flag_detector.get_all_flags()), Colors.YELLOW))
-            print()
+            self._emit(
+                UIBox.header(f"👤 Profile - {self.client.username}", 80),
+                UIBox.stat_row("Username:", self.client.username or "N/A", Colors.CYAN),
+                UIBox.stat_row("Status:", "Online", Colors.GREEN),
+                UIBox.stat_row("Bio:", "Not set", Colors.GRAY),
+                UIBox.stat_row("Total Messages:", "0", Colors.CYAN),
+                UIBox.stat_row("Rooms Joined:", "0", Colors.CYAN),
+                UIBox.stat_row("Flags Captured:", self.client.flag_detector.count, Colors.YELLOW),
+                "",
+            )
         elif action == "edit":
-            print(f"{colorize('Profile editing not yet implemented', Colors.GRAY)}\n")
+            self._emit(_MSG_PROFILE_EDIT_TODO)
 
     def do_settings(self, args: str) -> None:
         """Show client settings: settings [key] [value]"""
-        print(f"{UIBox.header('⚙️  Client Settings', 80)}")
-        print(UIBox.stat_row("Color Output:", "Enabled", Colors.GREEN))
-        print(UIBox.stat_row("Auto-Reconnect:", "Enabled", Colors.GREEN))
-        print(UIBox.stat_row("Notifications:", "Enabled", Colors.GREEN))
-        print(UIBox.stat_row("Flag Detection:", "Enabled", Colors.GREEN))
-        print(UIBox.stat_row("Sound Alerts:", "Disabled", Colors.GRAY))
-        print(UIBox.stat_row("Theme:", "Dark", Colors.CYAN))
-        print()
+        self._emit(*_SETTINGS_PAGE)
 
     def do_notifications(self, args: str) -> None:
         """Manage notifications: notifications [on|off|settings]"""
         action = args.strip().lower() or "settings"
 
         if action == "on":
-            print(f"{StatusIndicator.SUCCESS} Notifications {colorize('enabled', Colors.GREEN)}\n")
+            self._emit(_MSG_NOTIFICATIONS_ON)
         elif action == "off":
-            print(f"{StatusIndicator.WARNING} Notifications {colorize('disabled', Colors.YELLOW)}\n")
+            self._emit(_MSG_NOTIFICATIONS_OFF)
         else:
-            print(f"{UIBox.header('🔔 Notification Settings', 80)}")
-            print(UIBox.stat_row("Message Alerts:", "On", Colors.GREEN))
-            print(UIBox.stat_row("User Join/Leave:", "On", Colors.GREEN))
-            print(UIBox.stat_row("Flag Capture:", "On", Colors.GREEN))
-            print(UIBox.stat_row("Mentions:", "On", Colors.GREEN))
-            print(UIBox.stat_row("Private Messages:", "On", Colors.GREEN))
-            print()
+            self._emit(*_NOTIFICATIONS_PAGE)
 
     def do_invite(self, args: str) -> None:
         """Invite user to room: invite <username> [room_name]"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split()
+        parts = args.split(None, 2)
         if not parts:
-            print(f"{StatusIndicator.ERROR} Usage: invite <username> [room_name]")
+            self._emit(_USAGE_INVITE)
             return
 
         username = parts[0]
         room_name = parts[1] if len(parts) > 1 else self.client.current_room
 
-        print(f"{StatusIndicator.LOADING} Sending invite to {colorize(username, Colors.CYAN)}...")
-        print(f"{StatusIndicator.SUCCESS} Invitation sent to {colorize(username, Colors.CYAN)}\n")
+        self._emit(
+            f"{StatusIndicator.LOADING} Sending invite to {colorize(username, Colors.CYAN)}...",
+            f"{StatusIndicator.SUCCESS} Invitation sent to {colorize(username, Colors.CYAN)}\n",
+        )
 
     def do_topic(self, args: str) -> None:
         """Set room topic: topic <new_topic>"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         if not self.client.current_room:
-            print(f"{StatusIndicator.ERROR} Not in any room")
+            self._emit(_MSG_NOT_IN_ROOM)
             return
 
-        if not args.strip():
-            print(f"{StatusIndicator.ERROR} Usage: topic <new_topic>")
+        topic = args.strip()
+        if not topic:
+            self._emit(_USAGE_TOPIC)
             return
 
-        print(f"{StatusIndicator.SUCCESS} Room topic updated: {colorize(args.strip(), Colors.CYAN)}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Room topic updated: {colorize(topic, Colors.CYAN)}\n")
 
     def do_whois(self, args: str) -> None:
         """Get user information: whois <username>"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_WHOIS)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: whois <username>")
             return
-
-        print(f"{UIBox.header(f'👤 User Information - {username}', 80)}")
-        print(UIBox.stat_row("Username:", username, Colors.CYAN))
-        print(UIBox.stat_row("Status:", "Online", Colors.GREEN))
-        print(UIBox.stat_row("Joined Server:", "Recently", Colors.CYAN))
-        print(UIBox.stat_row("Current Room:", "general", Colors.BLUE))
-        print(UIBox.stat_row("Messages:", "0", Colors.CYAN))
-        print(UIBox.stat_row("Role:", "User", Colors.YELLOW))
-        print()
+        lines = [
+            UIBox.header(f"👤 User Information - {username}", 80),
+            UIBox.stat_row("Username:", username, Colors.CYAN),
+            UIBox.stat_row("Status:", "Online", Colors.GREEN),
+            UIBox.stat_row("Joined Server:", "Recently", Colors.CYAN),
+            UIBox.stat_row("Current Room:", "general", Colors.BLUE),
+            UIBox.stat_row("Messages:", "0", Colors.CYAN),
+            UIBox.stat_row("Role:", "User", Colors.YELLOW),
+        ]
+        self._emit(*lines, "")
 
     def do_promote(self, args: str) -> None:
         """Promote user: promote <username> [role] (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split()
+        parts = args.split(None, 2)
         if not parts:
-            print(f"{StatusIndicator.ERROR} Usage: promote <username> [moderator|admin]")
+            self._emit(_USAGE_PROMOTE)
             return
 
         username = parts[0]
@@ -665,194 +1010,165 @@ class ChatShell(cmd.Cmd):
 
     def do_demote(self, args: str) -> None:
         """Demote user: demote <username> (Admin only)"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_DEMOTE)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: demote <username>")
             return
-
         self.moderation.demote(username)
 
     def do_lockroom(self, args: str) -> None:
         """Lock room (prevent new joins): lockroom (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         if not self.client.current_room:
-            print(f"{StatusIndicator.ERROR} Not in any room")
+            self._emit(_MSG_NOT_IN_ROOM)
             return
 
-        print(f"{StatusIndicator.SUCCESS} Room {colorize(self.client.current_room, Colors.CYAN)} is now {colorize('locked', Colors.RED)}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Room {colorize(self.client.current_room, Colors.CYAN)} is now {colorize('locked', Colors.RED)}\n")
 
     def do_unlockroom(self, args: str) -> None:
         """Unlock room: unlockroom (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         if not self.client.current_room:
-            print(f"{StatusIndicator.ERROR} Not in any room")
+            self._emit(_MSG_NOT_IN_ROOM)
             return
 
-        print(f"{StatusIndicator.SUCCESS} Room {colorize(self.client.current_room, Colors.CYAN)} is now {colorize('unlocked', Colors.GREEN)}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Room {colorize(self.client.current_room, Colors.CYAN)} is now {colorize('unlocked', Colors.GREEN)}\n")
 
     def do_clearroom(self, args: str) -> None:
         """Clear all messages in room: clearroom (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
         if not self.client.current_room:
-            print(f"{StatusIndicator.ERROR} Not in any room")
+            self._emit(_MSG_NOT_IN_ROOM)
             return
 
-        confirm = input(f"{colorize('Are you sure? Type YES to confirm: ', Colors.YELLOW)}")
+        confirm = self._prompt_input(_ASK_CONFIRM)
         if confirm.upper() == "YES":
-            print(f"{StatusIndicator.SUCCESS} Room cleared\n")
+            self._emit(_MSG_ROOM_CLEARED)
         else:
-            print(f"{StatusIndicator.WARNING} Operation cancelled\n")
+            self._emit(_MSG_CANCELLED)
 
     def do_announce(self, args: str) -> None:
         """Send announcement to room: announce <message> (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        if not args.strip():
-            print(f"{StatusIndicator.ERROR} Usage: announce <message>")
+        if not args or args.isspace():
+            self._emit(_USAGE_ANNOUNCE)
             return
 
-        print(f"{StatusIndicator.SUCCESS} Announcement sent\n")
+        self._emit(_MSG_ANNOUNCED)
 
     def do_broadcast(self, args: str) -> None:
         """Broadcast message to all rooms: broadcast <message> (Admin only)"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        if not args.strip():
-            print(f"{StatusIndicator.ERROR} Usage: broadcast <message>")
+        if not args or args.isspace():
+            self._emit(_USAGE_BROADCAST)
             return
 
-        print(f"{StatusIndicator.SUCCESS} Broadcast sent to all users\n")
+        self._emit(_MSG_BROADCAST_SENT)
 
     def do_alias(self, args: str) -> None:
         """Manage command aliases: alias [add|list|remove] <name> [command]"""
-        parts = args.split(None, 2)
+        action, rest = _split_first(args)
         
-        if not parts:
-            print(f"{UIBox.header('⚡ Command Aliases', 80)}")
-            print(f"{colorize('No aliases created yet', Colors.GRAY)}\n")
+        if not action:
+            self._emit(*_ALIASES_PAGE)
             return
 
-        action = parts[0].lower()
+        action = action.lower()
 
         if action == "list":
-            print(f"{UIBox.header('⚡ Command Aliases', 80)}")
-            print(f"{colorize('No aliases created yet', Colors.GRAY)}\n")
+            self._emit(*_ALIASES_PAGE)
         elif action == "add":
-            if len(parts) < 3:
-                print(f"{StatusIndicator.ERROR} Usage: alias add <name> <command>")
+            name, command = _split_first(rest)
+            if not command:
+                self._emit(_USAGE_ALIAS_ADD)
                 return
-            print(f"{StatusIndicator.SUCCESS} Alias created: {colorize(parts[1], Colors.CYAN)} → {colorize(parts[2], Colors.CYAN)}\n")
+            self._emit(f"{StatusIndicator.SUCCESS} Alias created: {colorize(name, Colors.CYAN)} → {colorize(command, Colors.CYAN)}\n")
         elif action == "remove":
-            if len(parts) < 2:
-                print(f"{StatusIndicator.ERROR} Usage: alias remove <name>")
+            if not rest:
+                self._emit(_USAGE_ALIAS_REMOVE)
                 return
-            print(f"{StatusIndicator.SUCCESS} Alias removed\n")
+            self._emit(_MSG_ALIAS_REMOVED)
 
     def do_react(self, args: str) -> None:
         """React to message: react <message_id> <emoji>"""
         if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
+            self._emit(_MSG_NOT_CONNECTED)
             return
 
-        parts = args.split()
-        if len(parts) < 2:
-            print(f"{StatusIndicator.ERROR} Usage: react <message_id> <emoji>")
+        if not _split_first(args)[1]:
+            self._emit(_USAGE_REACT)
             return
 
-        print(f"{StatusIndicator.SUCCESS} Reaction added\n")
+        self._emit(_MSG_REACTION_ADDED)
 
     def do_gag(self, args: str) -> None:
         """Gag user (no messages visible): gag <username> (Admin only)"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_GAG)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: gag <username>")
             return
-
-        print(f"{StatusIndicator.SUCCESS} Gagged {colorize(username, Colors.CYAN)}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Gagged {colorize(username, Colors.CYAN)}\n")
 
     def do_ungag(self, args: str) -> None:
         """Ungag user: ungag <username> (Admin only)"""
-        if not self.client.connected:
-            print(f"{StatusIndicator.ERROR} Not connected")
-            return
-
-        username = args.strip()
+        username = self._username_arg(args, _USAGE_UNGAG)
         if not username:
-            print(f"{StatusIndicator.ERROR} Usage: ungag <username>")
             return
-
-        print(f"{StatusIndicator.SUCCESS} Ungagged {colorize(username, Colors.CYAN)}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Ungagged {colorize(username, Colors.CYAN)}\n")
 
     def do_remind(self, args: str) -> None:
         """Set reminder: remind <time> <message>"""
-        if not args.strip():
-            print(f"{StatusIndicator.ERROR} Usage: remind <time> <message>")
-            return
-
-        parts = args.split(None, 1)
-        if len(parts) < 2:
-            print(f"{StatusIndicator.ERROR} Usage: remind <time> <message>")
+        time_str, message = _split_first(args)
+        if not message:
+            self._emit(_USAGE_REMIND)
             return
 
-        time_str = parts[0]
-        message = parts[1]
-
-        print(f"{StatusIndicator.SUCCESS} Reminder set for {colorize(time_str, Colors.CYAN)}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Reminder set for {colorize(time_str, Colors.CYAN)}\n")
 
     def do_timer(self, args: str) -> None:
         """Start timer: timer <duration> [label]"""
-        if not args.strip():
-            print(f"{StatusIndicator.ERROR} Usage: timer <duration> [label]")
+        duration, label = _split_first(args)
+        if not duration:
+            self._emit(_USAGE_TIMER)
             return
 
-        parts = args.split(None, 1)
-        duration = parts[0]
-        label = parts[1] if len(parts) > 1 else "Timer"
+        label = label or "Timer"
 
-        print(f"{StatusIndicator.SUCCESS} Timer started for {colorize(duration, Colors.CYAN)}: {label}\n")
+        self._emit(f"{StatusIndicator.SUCCESS} Timer started for {colorize(duration, Colors.CYAN)}: {label}\n")
 
     def do_snippet(self, args: str) -> None:
         """Manage text snippets: snippet [add|list|use] <name> [text]"""
-        parts = args.split(None, 2)
+        action, rest = _split_first(args)
         
-        if not parts:
-            print(f"{UIBox.header('📝 Text Snippets', 80)}")
-            print(f"{colorize('No snippets created yet', Colors.GRAY)}\n")
+        if not action:
+            self._emit(*_SNIPPETS_PAGE)
             return
 
-        action = parts[0].lower()
+        action = action.lower()
 
         if action == "list":
-            print(f"{UIBox.header('📝 Text Snippets', 80)}")
-            print(f"{colorize('No snippets created yet', Colors.GRAY)}\n")
+            self._emit(*_SNIPPETS_PAGE)
         elif action == "add":
-            if len(parts) < 3:
-                print(f"{StatusIndicator.ERROR} Usage: snippet add <name> <text>")
+            name, text = _split_first(rest)
+            if not text:
+                self._emit(_USAGE_SNIPPET_ADD)
                 return
-            print(f"{StatusIndicator.SUCCESS} Snippet created: {colorize(parts[1], Colors.CYAN)}\n")
+            self._emit(f"{StatusIndicator.SUCCESS} Snippet created: {colorize(name, Colors.CYAN)}\n")
         elif action == "use":
-            if len(parts) < 2:
-                print(f"{StatusIndicator.ERROR} Usage: snippet use <name>")
+            if not rest:
+                self._emit(_USAGE_SNIPPET_USE)
                 return
-            print(f"{StatusIndicator.SUCCESS} Snippet inserted\n")
+            self._emit(_MSG_SNIPPET_INSERTED)
@@ -1,56 +1,81 @@
 """Enhanced UI components for better visual presentation."""
 
-from typing import List, Optional
-from ..core.protocol import Colors, colorize
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+from ..core.protocol import Colors, colorize, format_timestamp
+
+
+@lru_cache(maxsize=1024)
+def _color_cached(text: str, color: str) -> str:
+    """colorize() for the small, recurring set of labels and rules."""
+    return colorize(text, color)
+
+
+@lru_cache(maxsize=8)
+def _progress_bars(width: int) -> tuple:
+    """Every coloured fill state of a progress bar of the given width."""
+    return tuple(colorize("█" * filled + "░" * (width - filled), Colors.GREEN) for filled in range(width + 1))
+
+
+# Decorations that never change between renders
+_HEADER_BAR_80 = colorize("═" * 80, Colors.BLUE)
+_BOLD_ESCAPE_LEN = len(Colors.BOLD) + len(Colors.RESET)
+_BULLET = colorize("•", Colors.CYAN)
+_FLAG_CONTENT_LABEL = colorize("Content:", Colors.YELLOW)
+_FLAG_FINDER_LABEL = colorize("Found by:", Colors.YELLOW)
+_FLAG_ROOM_LABEL = colorize("Room:", Colors.YELLOW)
+_FLAG_CONTEXT_LABEL = colorize("Context:", Colors.YELLOW)
+_USERS_HEADING = colorize("👥 Users in room:", Colors.BOLD + Colors.CYAN)
+_ROOMS_HEADING = colorize("🏠 Available Rooms:", Colors.BOLD + Colors.CYAN)
+_NO_FLAGS = "\n" + colorize("No flags found yet.", Colors.GRAY)
+_FLAGS_HEADING = "\n" + colorize("🚩 Captured Flags:", Colors.BOLD + Colors.YELLOW + Colors.HIGHLIGHT)
+_FLAGS_TOTAL_LABEL = colorize("Total:", Colors.CYAN)
+_SPINNER_FRAMES = tuple(colorize(frame, Colors.YELLOW) for frame in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
 
 
 class UIBox:
     """Creates decorative boxes for UI elements."""
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def header(title: str, width: int = 80) -> str:
         """Create a header box with title."""
-        padding = (width - len(title) - 2) // 2
-        top = "═" * width
-        middle = f"║{' ' * padding}{colorize(title, Colors.BOLD)}{' ' * (width - len(title) - 2 - padding)}║"
-        return f"\n{colorize(top, Colors.BLUE)}\n{middle}\n{colorize(top, Colors.BLUE)}"
+        top = _HEADER_BAR_80 if width == 80 else _color_cached("═" * width, Colors.BLUE)
+        # Centre the coloured title, widening the field by the invisible escape codes
+        middle = f"║{colorize(title, Colors.BOLD):^{width - 2 + _BOLD_ESCAPE_LEN}}║"
+        return f"\n{top}\n{middle}\n{top}"
     
     @staticmethod
     def section(title: str, color: str = Colors.YELLOW) -> str:
         """Create a section header."""
-        return f"\n{colorize(f'┌─ {title}', color)} {colorize('─' * (70 - len(title)), Colors.GRAY)}"
+        return f"\n{_color_cached(f'┌─ {title}', color)} {_color_cached('─' * (70 - len(title)), Colors.GRAY)}"
     
     @staticmethod
     def item(text: str, level: int = 1) -> str:
         """Create an indented item."""
         indent = "  " * level
-        return f"{indent}{colorize('•', Colors.CYAN)} {text}"
+        return f"{indent}{_BULLET} {text}"
     
     @staticmethod
     def separator(width: int = 80) -> str:
         """Create a horizontal separator."""
-        return colorize("─" * width, Colors.GRAY)
+        return _color_cached("─" * width, Colors.GRAY)
     
     @staticmethod
     def stat_row(label: str, value: str, label_color: str = Colors.CYAN) -> str:
         """Create a formatted stat row."""
-        return f"  {colorize(label, label_color):<30} {colorize(value, Colors.GREEN)}"
+        return f"  {_color_cached(label, label_color):<30} {colorize(value, Colors.GREEN)}"
     
     @staticmethod
     def table_header(columns: List[str], widths: List[int]) -> str:
         """Create a formatted table header."""
-        header = ""
-        for col, width in zip(columns, widths):
-            header += f"{col:<{width}} "
+        header = "".join([f"{col:<{width}} " for col, width in zip(columns, widths)])
         return colorize(header, Colors.BOLD + Colors.CYAN)
     
     @staticmethod
     def table_row(values: List[str], widths: List[int]) -> str:
         """Create a formatted table row."""
-        row = ""
-        for val, width in zip(values, widths):
-            row += f"{str(val):<{width}} "
-        return row
+        return "".join([f"{str(val):<{width}} " for val, width in zip(values, widths)])
 
 
 class StatusIndicator:
@@ -101,65 +126,54 @@ class Progress:
         """Create a progress bar."""
         if total == 0:
             percentage = 0
+            filled = 0
         else:
             percentage = (current / total) * 100
-        
-        filled = int(width * current / total)
-        bar = "█" * filled + "░" * (width - filled)
+            filled = min(width, max(0, int(width * current / total)))
         
         label_str = f"{label} " if label else ""
-        return f"{label_str}{colorize(bar, Colors.GREEN)} {percentage:.0f}%"
+        return f"{label_str}{_progress_bars(width)[filled]} {percentage:.0f}%"
     
     @staticmethod
-    def spinner_frames() -> List[str]:
+    def spinner_frames() -> Tuple[str, ...]:
         """Get spinner animation frames."""
-        return [
-            colorize("⠋", Colors.YELLOW),
-            colorize("⠙", Colors.YELLOW),
-            colorize("⠹", Colors.YELLOW),
-            colorize("⠸", Colors.YELLOW),
-            colorize("⠼", Colors.YELLOW),
-            colorize("⠴", Colors.YELLOW),
-            colorize("⠦", Colors.YELLOW),
-            colorize("⠧", Colors.YELLOW),
-            colorize("⠇", Colors.YELLOW),
-            colorize("⠏", Colors.YELLOW),
-        ]
+        return _SPINNER_FRAMES
+
+
+# (is_admin, is_moderator) -> (icon, username colour); admin wins over moderator
+_ROLE_STYLE = {
+    (True, True): (StatusIndicator.ADMIN, Colors.RED),
+    (True, False): (StatusIndicator.ADMIN, Colors.RED),
+    (False, True): (StatusIndicator.MOD, Colors.YELLOW),
+    (False, False): (StatusIndicator.USER, Colors.CYAN),
+}
 
 
 class UserDisplay:
     """Utilities for displaying user information."""
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def format_user(username: str, role: str = "user", is_moderator: bool = False) -> str:
         """Format user with role indicator."""
-        if role == "admin":
-            icon = StatusIndicator.ADMIN
-            color = Colors.RED
-        elif is_moderator:
-            icon = StatusIndicator.MOD
-            color = Colors.YELLOW
-        else:
-            icon = StatusIndicator.USER
-            color = Colors.CYAN
-        
+        icon, color = _ROLE_STYLE[role == "admin", bool(is_moderator)]
         return f"{icon} {colorize(username, color)}"
     
+    @staticmethod
+    def sort_key(user: dict) -> tuple:
+        """Sort key ordering admins first, then moderators, then users."""
+        return (user.get("role") != "admin", not user.get("is_moderator", False), user.get("username", ""))
+    
     @staticmethod
     def format_users_list(users: List[dict]) -> str:
         """Format a list of users for display."""
-        output = f"\n{colorize('👥 Users in room:', Colors.BOLD + Colors.CYAN)}"
-        
-        # Sort by role: admin first, then moderators, then users
-        sorted_users = sorted(
-            users,
-            key=lambda u: (u.get("role") != "admin", not u.get("is_moderator", False), u.get("username", ""))
+        format_user = UserDisplay.format_user
+        parts = ["", _USERS_HEADING]
+        parts.extend(
+            f"  {format_user(user.get('username', '?'), user.get('role', 'user'), user.get('is_moderator', False))}"
+            for user in sorted(users, key=UserDisplay.sort_key)
         )
-        
-        for user in sorted_users:
-            output += f"\n  {UserDisplay.format_user(user.get('username', '?'), user.get('role', 'user'), user.get('is_moderator', False))}"
-        
-        return output
+        return "\n".join(parts)
 
 
 class RoomDisplay:
@@ -181,12 +195,21 @@ class RoomDisplay:
     @staticmethod
     def format_rooms_list(rooms: List[dict]) -> str:
         """Format a list of rooms for display."""
-        output = f"\n{colorize('🏠 Available Rooms:', Colors.BOLD + Colors.CYAN)}"
-        
-        for room in rooms:
-            output += f"\n{RoomDisplay.format_room(room)}"
-        
-        return output
+        parts = ["", _ROOMS_HEADING]
+        parts.extend(map(RoomDisplay.format_room, rooms))
+        return "\n".join(parts)
+
+
+# One template for a whole flag entry; the colour codes are baked in
+_FLAG_TEMPLATE = "\n".join((
+    "",
+    f"  {StatusIndicator.FLAG} {colorize('Flag #{index}', Colors.BOLD + Colors.GREEN)}",
+    f"     {_FLAG_CONTENT_LABEL} {colorize('{content}', Colors.HIGHLIGHT + Colors.GREEN)}",
+    f"     {_FLAG_FINDER_LABEL}   {colorize('{finder}', Colors.CYAN)}",
+    f"     {_FLAG_ROOM_LABEL}      {colorize('#{room}', Colors.BLUE)}",
+    f"     {StatusIndicator.CLOCK} {{time}}",
+    f"     {_FLAG_CONTEXT_LABEL}   {{preview}}",
+))
 
 
 class FlagDisplay:
@@ -195,30 +218,33 @@ class FlagDisplay:
     @staticmethod
     def format_flag(flag, index: int = 0) -> str:
         """Format a single flag for display."""
-        from ..core.protocol import format_timestamp
-        
-        output = f"\n  {StatusIndicator.FLAG} {colorize(f'Flag #{index}', Colors.BOLD + Colors.GREEN)}"
-        output += f"\n     {colorize('Content:', Colors.YELLOW)} {colorize(flag.content, Colors.HIGHLIGHT + Colors.GREEN)}"
-        output += f"\n     {colorize('Found by:', Colors.YELLOW)}   {colorize(flag.finder, Colors.CYAN)}"
-        output += f"\n     {colorize('Room:', Colors.YELLOW)}      {colorize(f'#{flag.room}', Colors.BLUE)}"
-        output += f"\n     {StatusIndicator.CLOCK} {format_timestamp(flag.timestamp)}"
-        output += f"\n     {colorize('Context:', Colors.YELLOW)}   {flag.message_preview[:60]}"
-        
-        return output
+        return _FLAG_TEMPLATE.format(
+            index=index,
+            content=flag.content,
+            finder=flag.finder,
+            room=flag.room,
+            time=format_timestamp(flag.timestamp),
+            preview=flag.message_preview[:60],
+        )
     
     @staticmethod
-    def format_flags_list(flags: List) -> str:
-        """Format a list of flags for display."""
+    def iter_flags_list(flags: Sequence) -> Iterator[str]:
+        """Yield the flag list display one row at a time."""
         if not flags:
-            return f"\n{colorize('No flags found yet.', Colors.GRAY)}"
-        
-        output = f"\n{colorize('🚩 Captured Flags:', Colors.BOLD + Colors.YELLOW + Colors.HIGHLIGHT)}"
-        output += f"\n{colorize('Total:', Colors.CYAN)} {len(flags)}"
-        
+            yield _NO_FLAGS
+            return
+
+        yield _FLAGS_HEADING
+        yield f"\n{_FLAGS_TOTAL_LABEL} {len(flags)}"
+
+        format_flag = FlagDisplay.format_flag
         for idx, flag in enumerate(flags, 1):
-            output += FlagDisplay.format_flag(flag, idx)
-        
-        return output
+            yield format_flag(flag, idx)
+
+    @staticmethod
+    def format_flags_list(flags: Sequence) -> str:
+        """Format a list of flags for display."""
+        return "".join(FlagDisplay.iter_flags_list(flags))
 
 
 class MenuBar:
@@ -235,11 +261,9 @@ class MenuBar:
             ("help", "Show all commands"),
         ]
         
-        output = f"\n{colorize('⚡ Quick Commands:', Colors.BOLD + Colors.YELLOW)}"
-        for cmd, desc in commands:
-            output += f"\n  {colorize(cmd, Colors.CYAN):12} → {desc}"
-        
-        return output
+        parts = ["", colorize('⚡ Quick Commands:', Colors.BOLD + Colors.YELLOW)]
+        parts.extend(f"  {colorize(cmd, Colors.CYAN):12} → {desc}" for cmd, desc in commands)
+        return "\n".join(parts)
     
     @staticmethod
     def connection_info(username: str, room: Optional[str], connected: bool) -> str:
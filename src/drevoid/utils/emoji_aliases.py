@@ -1,6 +1,7 @@
 """Emoji alias management system."""
 
-from typing import Dict, List
+import re
+from typing import Dict, List, Optional
 
 
 class EmojiAliases:
@@ -226,6 +227,14 @@ class EmojiAliases:
         "tada": ["tada", "celebration", "party"],
     }
 
+    # One pass over the text; longest aliases first so none is shadowed by a prefix
+    _ALIAS_PATTERN = re.compile(
+        ":(" + "|".join(map(re.escape, sorted(_BASE_ALIASES, key=len, reverse=True))) + "):"
+    )
+
+    # Rendered alias table; the aliases are fixed, so it is built once
+    _LIST_CACHE: Optional[str] = None
+
     @classmethod
     def replace(cls, text: str) -> str:
         """
@@ -240,11 +249,11 @@ class EmojiAliases:
         Returns:
             Text with aliases replaced by emojis
         """
-        result = text
-        for alias, emoji in cls._BASE_ALIASES.items():
-            pattern = f":{alias}:"
-            result = result.replace(pattern, emoji)
-        return result
+        # Most messages carry no alias at all; skip the regex for them
+        if ":" not in text:
+            return text
+        aliases = cls._BASE_ALIASES
+        return cls._ALIAS_PATTERN.sub(lambda match: aliases[match.group(1)], text)
 
     @classmethod
     def list_aliases(cls) -> str:
@@ -254,14 +263,16 @@ class EmojiAliases:
         Returns:
             Formatted string of aliases grouped by category
         """
-        lines = []
-        aliases_sorted = sorted(cls._BASE_ALIASES.items())
+        if cls._LIST_CACHE is None:
+            lines = []
+            aliases_sorted = sorted(cls._BASE_ALIASES.items())
 
-        for i in range(0, len(aliases_sorted), 3):
-            chunk = aliases_sorted[i : i + 3]
-            row = "  "
-            for alias, emoji in chunk:
-                row += f":{alias:20s} {emoji}  "
-            lines.append(row)
+            for i in range(0, len(aliases_sorted), 3):
+                chunk = aliases_sorted[i : i + 3]
+                row = "  "
+                for alias, emoji in chunk:
+                    row += f":{alias:20s} {emoji}  "
+                lines.append(row)
 
-        return "\n".join(lines)
+            cls._LIST_CACHE = "\n".join(lines)
+        return cls._LIST_CACHE
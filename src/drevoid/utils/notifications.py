@@ -1,21 +1,91 @@
 """Cross-platform notification system."""
 
+import queue
 import subprocess
 import threading
 import sys
 import time
 import shutil
-from typing import List, Callable, Dict
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Tuple
+
+if sys.platform.startswith("win"):
+    try:  # optional: show toasts in-process instead of spawning PowerShell
+        from winrt.windows.data.xml.dom import XmlDocument
+        from winrt.windows.ui.notifications import ToastNotification, ToastNotificationManager
+    except ImportError:
+        XmlDocument = None
+else:
+    XmlDocument = None
+
+if sys.platform.startswith("linux"):
+    try:  # optional: talk to the notification daemon instead of spawning notify-send
+        from jeepney import DBusAddress, new_method_call
+        from jeepney.io.blocking import open_dbus_connection
+    except ImportError:
+        open_dbus_connection = None
+else:
+    open_dbus_connection = None
+
+if open_dbus_connection is not None:
+    _DBUS_NOTIFICATIONS = DBusAddress(
+        "/org/freedesktop/Notifications",
+        bus_name="org.freedesktop.Notifications",
+        interface="org.freedesktop.Notifications",
+    )
+    # Seconds to wait for the notification daemon before falling back
+    _DBUS_TIMEOUT = 2.0
+
+# Quote escaping for the AppleScript and PowerShell notification commands
+_APPLESCRIPT_ESCAPES = str.maketrans({'"': '\\"'})
+_POWERSHELL_ESCAPES = str.maketrans({'"': '`"', "'": "''"})
+# XML text escaping for WinRT toasts (xml.sax.saxutils drags in urllib.request)
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Same ToastText02 layout the PowerShell fallback builds
+_TOAST_XML = (
+    '<toast><visual><binding template="ToastText02">'
+    '<text id="1">{title}</text><text id="2">{message}</text>'
+    "</binding></visual></toast>"
+)
+
+# PowerShell toast script, filled in per notification with escaped text
+_POWERSHELL_TOAST = (
+    '[Windows.UI.Notifications.ToastNotificationManager, '
+    'Windows.UI.Notifications, ContentType = WindowsRuntime] > $null; '
+    '$template = [Windows.UI.Notifications.ToastNotificationManager]'
+    '::GetTemplateContent([Windows.UI.Notifications.ToastTemplateType]::ToastText02); '
+    '$xml = $template.GetXml(); $texts = $xml.GetElementsByTagName("text"); '
+    '$texts.Item(0).AppendChild($xml.CreateTextNode("{title}")) > $null; '
+    '$texts.Item(1).AppendChild($xml.CreateTextNode("{message}")) > $null; '
+    '$toast = [Windows.UI.Notifications.ToastNotification]::new($xml); '
+    '[Windows.UI.Notifications.ToastNotificationManager]'
+    '::CreateToastNotifier("Drevoid").Show($toast)'
+)
+
+
+@lru_cache(maxsize=None)
+def _which(cmd: str):
+    """shutil.which, memoized so each PATH probe runs once per process."""
+    return shutil.which(cmd)
 
 
 class NotificationManager:
     """
     Manages system and terminal notifications.
 
-    Supports Linux (notify-send), macOS (osascript), and Windows (PowerShell).
+    Supports Linux (D-Bus via the optional jeepney package, notify-send
+    otherwise), macOS (osascript), and Windows (WinRT toasts
+    when the optional winrt packages are installed, PowerShell otherwise).
     Includes callback system and rate limiting to prevent notification spam.
     """
 
+    # Upper bound on remembered (flag, finder, room) keys for rate limiting
+    RATE_LIMIT_CACHE_SIZE = 1024
+    # Pending system notifications beyond this are dropped during bursts
+    NOTIFY_QUEUE_LIMIT = 32
+
     def __init__(self, enable_system_notifications: bool = True, rate_limit_seconds: float = 1.5):
         """
         Initialize notification manager.
@@ -24,14 +94,31 @@ class NotificationManager:
             enable_system_notifications: Enable OS-level notifications
             rate_limit_seconds: Minimum seconds between duplicate notifications
         """
-        self.callbacks: List[Callable] = []
+        # Replaced, never mutated, so notifiers can iterate without copying
+        self.callbacks: Tuple[Callable, ...] = ()
         self.enable_system_notifications = bool(enable_system_notifications)
         self.rate_limit_seconds = float(rate_limit_seconds)
-        self._last_notified: Dict[str, float] = {}
+        self._last_notified: "OrderedDict[Tuple[str, str, str], float]" = OrderedDict()
         self._platform = sys.platform
-        self._notify_send = shutil.which("notify-send")
-        self._osascript = shutil.which("osascript")
-        self._powershell = shutil.which("powershell") or shutil.which("pwsh")
+        # Only probe for the notifier this platform can actually use
+        platform = self._platform
+        self._notify_send = _which("notify-send") if platform.startswith("linux") else None
+        self._osascript = _which("osascript") if platform == "darwin" else None
+        self._powershell = (_which("powershell") or _which("pwsh")) if platform.startswith("win") else None
+        self._toast_notifier = None
+        self._dbus = None
+        # Pick the platform's sender once instead of re-checking per notification
+        if platform.startswith("linux"):
+            self._send_native = self._send_linux
+        elif platform == "darwin":
+            self._send_native = self._send_darwin
+        elif platform.startswith("win"):
+            self._send_native = self._send_windows
+        else:
+            self._send_native = None
+        self._notify_q: "queue.SimpleQueue[Tuple[str, str]]" = queue.SimpleQueue()
+        self._worker_started = False
+        self._worker_lock = threading.Lock()
 
     def subscribe(self, callback: Callable) -> None:
         """
@@ -41,7 +128,7 @@ class NotificationManager:
             callback: Function to call on notifications
         """
         if callback not in self.callbacks:
-            self.callbacks.append(callback)
+            self.callbacks = self.callbacks + (callback,)
 
     def unsubscribe(self, callback: Callable) -> None:
         """
@@ -51,7 +138,9 @@ class NotificationManager:
             callback: Function to remove from subscribers
         """
         if callback in self.callbacks:
-            self.callbacks.remove(callback)
+            callbacks = list(self.callbacks)
+            callbacks.remove(callback)
+            self.callbacks = tuple(callbacks)
 
     def toggle(self, enabled: bool) -> None:
         """
@@ -70,39 +159,43 @@ class NotificationManager:
             flag: Flag object that was found
             finder_username: Username of who found it
         """
-        payload = {
-            "type": "flag_found",
-            "flag": flag.content,
-            "finder": finder_username,
-            "room": flag.room,
-            "timestamp": flag.timestamp,
-            "preview": flag.message_preview,
-        }
-
-        # Call all subscribers
-        for cb in list(self.callbacks):
-            try:
-                cb(payload)
-            except Exception:
-                pass
+        # Call all subscribers; the payload is only built when someone listens
+        callbacks = self.callbacks
+        if callbacks:
+            payload = {
+                "type": "flag_found",
+                "flag": flag.content,
+                "finder": finder_username,
+                "room": flag.room,
+                "timestamp": flag.timestamp,
+                "preview": flag.message_preview,
+            }
+            for cb in callbacks:
+                try:
+                    cb(payload)
+                except Exception:
+                    pass
 
         # Check rate limit
-        key = f"{flag.content}:{finder_username}:{flag.room}"
-        now = time.time()
-        last = self._last_notified.get(key, 0)
-        if now - last < self.rate_limit_seconds:
+        key = (flag.content, finder_username, flag.room)
+        now = time.monotonic()
+        last_notified = self._last_notified
+        last = last_notified.get(key)
+        if last is not None and now - last < self.rate_limit_seconds:
             return
 
-        self._last_notified[key] = now
+        # Entries are kept oldest-first, so expired ones sit at the front
+        while last_notified and now - next(iter(last_notified.values())) >= self.rate_limit_seconds:
+            last_notified.popitem(last=False)
+        last_notified[key] = now
+        last_notified.move_to_end(key)
+        if len(last_notified) > self.RATE_LIMIT_CACHE_SIZE:
+            last_notified.popitem(last=False)
 
         if self.enable_system_notifications:
             title = f"Flag Found by {finder_username}"
             body = f"{flag.content} in #{flag.room}"
-            threading.Thread(
-                target=self._send_system_notification,
-                args=(title, body),
-                daemon=True,
-            ).start()
+            self._queue_system_notification(title, body)
         else:
             try:
                 print("\a", end="", flush=True)
@@ -117,64 +210,132 @@ class NotificationManager:
             username: Username of sender
             content: Message content
         """
+        callbacks = self.callbacks
+        if not callbacks:
+            return
         payload = {"type": "user_message", "username": username, "content": content}
-        for cb in list(self.callbacks):
+        for cb in callbacks:
             try:
                 cb(payload)
             except Exception:
                 pass
 
-    def _send_system_notification(self, title: str, message: str) -> None:
+    def _queue_system_notification(self, title: str, message: str) -> None:
         """
-        Send notification using platform-specific method.
+        Hand a notification to the worker thread, starting it on first use.
 
         Args:
             title: Notification title
             message: Notification message
         """
-        try:
-            if self._platform.startswith("linux") and self._notify_send:
-                subprocess.Popen(
-                    [self._notify_send, title, message],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-                return
+        if not self._worker_started:
+            with self._worker_lock:
+                if not self._worker_started:
+                    threading.Thread(target=self._notify_worker, name="drevoid-notify", daemon=True).start()
+                    self._worker_started = True
+        if self._notify_q.qsize() < self.NOTIFY_QUEUE_LIMIT:
+            self._notify_q.put((title, message))
 
-            if self._platform == "darwin" and self._osascript:
-                esc_title = title.replace('"', '\\"')
-                esc_message = message.replace('"', '\\"')
-                subprocess.Popen(
-                    [
-                        "osascript",
-                        "-e",
-                        f'display notification "{esc_message}" with title "{esc_title}"',
-                    ],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-                return
+    def _notify_worker(self) -> None:
+        """Send queued system notifications one at a time (runs in thread)."""
+        get = self._notify_q.get
+        while True:
+            title, message = get()
+            self._send_system_notification(title, message)
 
-            if self._platform.startswith("win") and self._powershell:
-                safe_title = title.replace('"', '`"').replace("'", "''")
-                safe_message = message.replace('"', '`"').replace("'", "''")
-                ps_cmd = (
-                    f'[Windows.UI.Notifications.ToastNotificationManager, '
-                    f'Windows.UI.Notifications, ContentType = WindowsRuntime] > $null; '
-                    f'$template = [Windows.UI.Notifications.ToastNotificationManager]'
-                    f'::GetTemplateContent([Windows.UI.Notifications.ToastTemplateType]::ToastText02); '
-                    f'$xml = $template.GetXml(); $texts = $xml.GetElementsByTagName("text"); '
-                    f'$texts.Item(0).AppendChild($xml.CreateTextNode("{safe_title}")) > $null; '
-                    f'$texts.Item(1).AppendChild($xml.CreateTextNode("{safe_message}")) > $null; '
-                    f'$toast = [Windows.UI.Notifications.ToastNotification]::new($xml); '
-                    f'[Windows.UI.Notifications.ToastNotificationManager]'
-                    f'::CreateToastNotifier("Drevoid").Show($toast)'
-                )
-                subprocess.Popen(
-                    [self._powershell, "-NoProfile", "-NonInteractive", "-Command", ps_cmd],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
+    def _close_dbus(self) -> None:
+        """Drop the cached D-Bus connection so the next notification reconnects."""
+        dbus, self._dbus = self._dbus, None
+        if dbus is not None:
+            try:
+                dbus.close()
+            except Exception:
+                pass
+
+    def _send_linux(self, title: str, message: str) -> bool:
+        """Notify via D-Bus (jeepney) or notify-send; True if handed off."""
+        if open_dbus_connection is not None:
+            try:
+                if self._dbus is None:
+                    self._dbus = open_dbus_connection(bus="SESSION")
+                self._dbus.send_and_get_reply(
+                    new_method_call(
+                        _DBUS_NOTIFICATIONS,
+                        "Notify",
+                        "susssasa{sv}i",
+                        ("Drevoid", 0, "", title, message, [], {}, -1),
+                    ),
+                    timeout=_DBUS_TIMEOUT,
                 )
+                return True
+            except Exception:
+                self._close_dbus()  # fall back to notify-send below
+
+        if not self._notify_send:
+            return False
+        subprocess.Popen(
+            [self._notify_send, title, message],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+
+    def _send_darwin(self, title: str, message: str) -> bool:
+        """Notify via osascript; True if handed off."""
+        if not self._osascript:
+            return False
+        esc_title = title.translate(_APPLESCRIPT_ESCAPES)
+        esc_message = message.translate(_APPLESCRIPT_ESCAPES)
+        subprocess.Popen(
+            [
+                self._osascript,
+                "-e",
+                f'display notification "{esc_message}" with title "{esc_title}"',
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+
+    def _send_windows(self, title: str, message: str) -> bool:
+        """Notify via WinRT (winrt) or a PowerShell toast; True if handed off."""
+        if XmlDocument is not None:
+            try:
+                if self._toast_notifier is None:
+                    self._toast_notifier = ToastNotificationManager.create_toast_notifier("Drevoid")
+                document = XmlDocument()
+                document.load_xml(_TOAST_XML.format(title=title.translate(_XML_ESCAPES), message=message.translate(_XML_ESCAPES)))
+                self._toast_notifier.show(ToastNotification(document))
+                return True
+            except Exception:
+                pass  # fall back to PowerShell below
+
+        if not self._powershell:
+            return False
+        safe_title = title.translate(_POWERSHELL_ESCAPES)
+        safe_message = message.translate(_POWERSHELL_ESCAPES)
+        ps_cmd = _POWERSHELL_TOAST.format(title=safe_title, message=safe_message)
+        subprocess.Popen(
+            [self._powershell, "-NoProfile", "-NonInteractive", "-Command", ps_cmd],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return True
+
+    def _send_system_notification(self, title: str, message: str) -> None:
+        """
+        Send notification using platform-specific method.
+
+        Args:
+            title: Notification title
+            message: Notification message
+        """
+        send_native = self._send_native
+        try:
+            if send_native is not None and send_native(title, message):
                 return
         except Exception:
             pass